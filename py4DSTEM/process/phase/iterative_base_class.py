@@ -23,7 +23,12 @@ from py4DSTEM.process.calibration import fit_origin
 from py4DSTEM.process.phase.iterative_ptychographic_constraints import (
     PtychographicConstraints,
 )
-from py4DSTEM.process.phase.utils import AffineTransform, polar_aliases
+from py4DSTEM.process.phase.utils import (
+    AffineTransform,
+    polar_aliases,
+    scatter_add_conjugate_product_imag,
+    scatter_add_patches,
+)
 from py4DSTEM.process.utils import (
     electron_wavelength_angstrom,
     fourier_resample,
@@ -1492,6 +1497,24 @@ class PtychographicReconstruction(PhaseReconstruction, PtychographicConstraints)
             Summed array
         """
         xp = self._xp
+        x0, y0, x_ind, y_ind = self._overlapping_patches_offsets()
+
+        return scatter_add_patches(
+            patches, x0, y0, x_ind, y_ind, self._object_shape, xp
+        )
+
+    def _overlapping_patches_offsets(self):
+        """
+        Integer patch origins and pixel offsets used to sum overlapping patches.
+
+        Returns
+        -------
+        x0, y0: (Rx*Ry,) np.ndarray
+            Rounded patch origins along each axis
+        x_ind, y_ind: np.ndarray
+            Pixel offsets of the patch along each axis, of length Sx and Sy
+        """
+        xp = self._xp
         x0 = xp.round(self._positions_px[:, 0]).astype("int")
         y0 = xp.round(self._positions_px[:, 1]).astype("int")
 
@@ -1499,18 +1522,43 @@ class PtychographicReconstruction(PhaseReconstruction, PtychographicConstraints)
         x_ind = xp.round(xp.arange(roi_shape[0]) - roi_shape[0] / 2).astype("int")
         y_ind = xp.round(xp.arange(roi_shape[1]) - roi_shape[1] / 2).astype("int")
 
-        flat_weights = patches.ravel()
-        indices = (
-            (y0[:, None, None] + y_ind[None, None, :]) % self._object_shape[1]
-        ) + (
-            (x0[:, None, None] + x_ind[None, :, None]) % self._object_shape[0]
-        ) * self._object_shape[
-            1
-        ]
-        counts = xp.bincount(
-            indices.ravel(), weights=flat_weights, minlength=np.prod(self._object_shape)
+        return x0, y0, x_ind, y_ind
+
+    def _sum_overlapping_conjugate_product_imag(
+        self, object_patches, shifted_probes, exit_waves
+    ):
+        """
+        Sums imag(conj(object_patches) * conj(shifted_probes) * exit_waves) into
+        an object shaped array, fusing the product into the scatter where possible.
+
+        Parameters
+        ----------
+        object_patches: (Rx*Ry,Sx,Sy) np.ndarray
+            Patched object view
+        shifted_probes: (Rx*Ry,Sx,Sy) np.ndarray
+            Fractionally-shifted probes
+        exit_waves: (Rx*Ry,Sx,Sy) np.ndarray
+            Exit waves
+
+        Returns
+        -------
+        out_array: (Px,Py) np.ndarray
+            Summed array
+        """
+        xp = self._xp
+        x0, y0, x_ind, y_ind = self._overlapping_patches_offsets()
+
+        return scatter_add_conjugate_product_imag(
+            object_patches,
+            shifted_probes,
+            exit_waves,
+            x0,
+            y0,
+            x_ind,
+            y_ind,
+            self._object_shape,
+            xp,
         )
-        return xp.reshape(counts, self._object_shape)
 
     def _sum_overlapping_patches_bincounts(self, patches: np.ndarray):
         """
@@ -1536,20 +1584,34 @@ class PtychographicReconstruction(PhaseReconstruction, PtychographicConstraints)
         else:
             return self._sum_overlapping_patches_bincounts_base(patches)
 
-    def _extract_vectorized_patch_indices(self):
+    def _extract_vectorized_patch_indices(self, positions_px_rounded=None):
         """
         Sets the vectorized row/col indices used for the overlap projection
 
+        Parameters
+        ----------
+        positions_px_rounded: np.ndarray, optional
+            Pre-rounded self._positions_px. If None, computed from self._positions_px
+
         Returns
         -------
-        self._vectorized_patch_indices_row: np.ndarray
+        self._vectorized_patch_indices_row: (Rx*Ry,Sx,1) np.ndarray
             Row indices for probe patches inside object array
-        self._vectorized_patch_indices_col: np.ndarray
+        self._vectorized_patch_indices_col: (Rx*Ry,1,Sy) np.ndarray
             Column indices for probe patches inside object array
+
+        Notes
+        -----
+        The indices are returned in broadcastable form, so that fancy-indexing
+        the object with both yields the full (Rx*Ry,Sx,Sy) patches while only
+        Rx*Ry*(Sx+Sy) indices are stored.
         """
         xp = self._xp
-        x0 = xp.round(self._positions_px[:, 0]).astype("int")
-        y0 = xp.round(self._positions_px[:, 1]).astype("int")
+        if positions_px_rounded is None:
+            positions_px_rounded = xp.round(self._positions_px)
+
+        x0 = positions_px_rounded[:, 0].astype("int")
+        y0 = positions_px_rounded[:, 1].astype("int")
 
         roi_shape = self._region_of_interest_shape
         x_ind = xp.round(xp.arange(roi_shape[0]) - roi_shape[0] / 2).astype("int")
@@ -1565,6 +1627,45 @@ class PtychographicReconstruction(PhaseReconstruction, PtychographicConstraints)
 
         return vectorized_patch_indices_row, vectorized_patch_indices_col
 
+    def _decimated_error_iterations(self, max_points: int = 2000):
+        """
+        Returns the convergence curve, reduced to at most about max_points
+        points for plotting by keeping the minimum and maximum error of
+        consecutive buckets of iterations.
+
+        Parameters
+        ----------
+        max_points: int, optional
+            Number of points above which the curve is decimated
+
+        Returns
+        -------
+        iterations: np.ndarray
+            Iteration numbers of the retained points
+        errors: np.ndarray
+            Errors at the retained points
+        """
+        errors = np.asarray(self.error_iterations, dtype=np.float32)
+        num_iter = errors.shape[0]
+
+        if num_iter <= max_points:
+            return np.arange(num_iter), errors
+
+        bucket_size = -(-num_iter // (max_points // 2))
+        num_buckets = num_iter // bucket_size
+        buckets = errors[: num_buckets * bucket_size].reshape(num_buckets, -1)
+
+        # keep the extrema of each bucket in iteration order
+        extrema = np.sort(
+            np.stack((buckets.argmin(axis=1), buckets.argmax(axis=1)), axis=1), axis=1
+        )
+        extrema += bucket_size * np.arange(num_buckets)[:, None]
+        iterations = np.concatenate(
+            (extrema.ravel(), np.arange(num_buckets * bucket_size, num_iter))
+        )
+
+        return iterations, errors[iterations]
+
     def _crop_rotate_object_fov(
         self,
         array,
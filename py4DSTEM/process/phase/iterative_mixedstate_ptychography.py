@@ -181,6 +181,7 @@ class MixedstatePtychographicReconstruction(PtychographicReconstruction):
 
         # Class-specific Metadata
         self._num_probes = num_probes
+        self._butterworth_envelope_cache = None
 
     def preprocess(
         self,
@@ -1510,6 +1511,7 @@ class MixedstatePtychographicReconstruction(PtychographicReconstruction):
         if reset:
             self._object = self._object_initial.copy()
             self.error_iterations = []
+            self._butterworth_envelope_cache = None
             self._probe = self._probe_initial.copy()
             self._positions_px = self._positions_px_initial.copy()
             self._positions_px_fractional = self._positions_px - xp.round(
@@ -4,6 +4,8 @@ namely overlap magnetic tomography.
 """
 
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Mapping, Sequence, Tuple
 
 import matplotlib.pyplot as plt
@@ -12,7 +14,7 @@ from matplotlib.gridspec import GridSpec
 from mpl_toolkits.axes_grid1 import make_axes_locatable
 from py4DSTEM.visualize import show
 from py4DSTEM.visualize.vis_special import Complex2RGB, add_colorbar_arg
-from scipy.ndimage import rotate as rotate_np
+from scipy.ndimage import affine_transform as affine_transform_np
 
 try:
     import cupy as cp
@@ -24,11 +26,16 @@ from py4DSTEM import DataCube
 from py4DSTEM.process.phase.iterative_base_class import PtychographicReconstruction
 from py4DSTEM.process.phase.utils import (
     ComplexProbe,
+    complex_exponential,
+    expand_sliced_volume,
     fft_shift,
     generate_batches,
+    phase_replace,
     polar_aliases,
     polar_symbols,
+    project_sliced_volume,
     project_vector_field_divergence,
+    solve_position_updates,
     spatial_frequencies,
 )
 from py4DSTEM.process.utils import electron_wavelength_angstrom, get_CoM, get_shifted_ar
@@ -75,8 +82,8 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
         Pixel dimensions to pad object with
         If None, the padding is set to half the probe ROI dimensions
     initial_object_guess: np.ndarray, optional
-        Initial guess for complex-valued object of dimensions (Px,Py,Py)
-        If None, initialized to 1.0
+        Initial guess for the (V, Az, Ax, Ay) object of dimensions (4,Px,Py,Py)
+        If None, initialized to 0.0
     initial_probe_guess: np.ndarray, optional
         Initial guess for complex-valued probe of dimensions (Sx,Sy). If None,
         initialized to ComplexProbe with semiangle_cutoff, energy, and aberrations
@@ -124,19 +131,42 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
         if device == "cpu":
             self._xp = np
             self._asnumpy = np.asarray
-            from scipy.ndimage import gaussian_filter, rotate, zoom
+            from scipy.fft import fft2, ifft2
+            from scipy.ndimage import (
+                affine_transform,
+                gaussian_filter,
+                rotate,
+                spline_filter,
+                zoom,
+            )
 
             self._gaussian_filter = gaussian_filter
             self._zoom = zoom
             self._rotate = rotate
+            self._affine_transform = affine_transform
+            self._spline_filter = spline_filter
+            # multi-threaded, and keeps complex64 inputs in single precision
+            self._fft2 = partial(fft2, workers=-1)
+            self._ifft2 = partial(ifft2, workers=-1)
         elif device == "gpu":
             self._xp = cp
             self._asnumpy = cp.asnumpy
-            from cupyx.scipy.ndimage import gaussian_filter, rotate, zoom
+            from cupyx.scipy.ndimage import (
+                affine_transform,
+                gaussian_filter,
+                rotate,
+                spline_filter,
+                zoom,
+            )
 
             self._gaussian_filter = gaussian_filter
             self._zoom = zoom
             self._rotate = rotate
+            self._affine_transform = affine_transform
+            self._spline_filter = spline_filter
+            # cupy caches cuFFT plans for repeated shapes
+            self._fft2 = cp.fft.fft2
+            self._ifft2 = cp.fft.ifft2
         else:
             raise ValueError(f"device must be either 'cpu' or 'gpu', not {device}")
 
@@ -182,6 +212,11 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
         self._num_slices = num_slices
         self._tilt_angles_deg = tuple(tilt_angles_deg)
         self._num_tilts = num_tilts
+        self._rotation_matrices_cache = {}
+        self._gaussian_kernels_cache = {}
+        self._butterworth_kernels_cache = {}
+        self._projection_rotation_buffer = None
+        self._exit_waves_scratch = None
 
     def _precompute_propagator_arrays(
         self,
@@ -249,9 +284,7 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
         propagated_array: np.ndarray
             Fourier-convolved array
         """
-        xp = self._xp
-
-        return xp.fft.ifft2(xp.fft.fft2(array) * propagator_array)
+        return self._ifft2(self._fft2(array) * propagator_array)
 
     def _project_sliced_object(self, array: np.ndarray, output_z):
         """
@@ -270,24 +303,7 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
         expanded_or_projected_array: np.ndarray
             expanded or projected array
         """
-        xp = self._xp
-        input_z = array.shape[0]
-
-        voxels_per_slice = np.ceil(input_z / output_z).astype("int")
-        pad_size = voxels_per_slice * output_z - input_z
-
-        padded_array = xp.pad(array, ((0, pad_size), (0, 0), (0, 0)))
-
-        return xp.sum(
-            padded_array.reshape(
-                (
-                    -1,
-                    voxels_per_slice,
-                )
-                + array.shape[1:]
-            ),
-            axis=1,
-        )
+        return project_sliced_volume(array, output_z, xp=self._xp)
 
     def _expand_sliced_object(self, array: np.ndarray, output_z):
         """
@@ -306,23 +322,190 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
         expanded_or_projected_array: np.ndarray
             expanded or projected array
         """
+        return expand_sliced_volume(array, output_z, xp=self._xp)
+
+    def _euler_angle_rotation_matrix(
+        self,
+        alpha_deg,
+        beta_deg,
+        volume_shape,
+    ):
+        """
+        Returns the affine matrix and offset mapping output to input coordinates for
+        the Euler-angle rotation used in _euler_angle_rotate_volume.
+        Results are cached per (alpha, beta, volume_shape).
+
+        Parameters
+        ----------
+        alpha_deg: float
+            Tilt around first axis (z) in degrees
+        beta_deg: float
+            Tilt around second axis (x) in degrees
+        volume_shape: Tuple[int,int,int]
+            Shape of rotated volume
+
+        Returns
+        -------
+        rotation_matrix: np.ndarray
+            (3,3) rotation matrix
+        offset: tuple
+            Offset rotating volume around its center
+        """
         xp = self._xp
-        input_z = array.shape[0]
+        key = (alpha_deg, beta_deg, tuple(volume_shape))
+
+        if key not in self._rotation_matrices_cache:
+            rotation_matrix = (
+                self._plane_rotation_matrix(-alpha_deg, (1, 2))
+                @ self._plane_rotation_matrix(-beta_deg, (0, 2))
+                @ self._plane_rotation_matrix(alpha_deg, (1, 2))
+            )
 
-        voxels_per_slice = np.ceil(output_z / input_z).astype("int")
-        remainder_size = voxels_per_slice - (voxels_per_slice * input_z - output_z)
+            center = (np.array(volume_shape) - 1) / 2
+            offset = center - rotation_matrix @ center
 
-        voxels_in_slice = xp.repeat(voxels_per_slice, input_z)
-        voxels_in_slice[-1] = remainder_size if remainder_size > 0 else voxels_per_slice
+            self._rotation_matrices_cache[key] = (
+                xp.asarray(rotation_matrix),
+                tuple(offset),
+            )
 
-        normalized_array = array / xp.asarray(voxels_in_slice)[:, None, None]
-        return xp.repeat(normalized_array, voxels_per_slice, axis=0)[:output_z]
+        return self._rotation_matrices_cache[key]
+
+    @staticmethod
+    def _plane_rotation_matrix(angle_deg, axes):
+        """
+        Returns the (3,3) matrix rotating by angle_deg in the plane defined by axes,
+        using the same convention as ndimage.rotate.
+        """
+        c, s = np.cos(np.deg2rad(angle_deg)), np.sin(np.deg2rad(angle_deg))
+        i, j = sorted(axis % 3 for axis in axes)
+        matrix = np.eye(3)
+        matrix[i, i] = c
+        matrix[i, j] = s
+        matrix[j, i] = -s
+        matrix[j, j] = c
+        return matrix
+
+    def _projection_rotate_volume(
+        self,
+        volume_array,
+        angle_deg,
+        axes,
+        order=1,
+    ):
+        """
+        Rotates 3D volume by angle_deg in the plane defined by axes, equivalent to
+        rotate(volume_array, angle_deg, axes=axes, reshape=False, order=order).
+        Only used to project the object for display, so defaults to linear
+        interpolation, which needs no spline prefilter.
+        Rotations act on the last three axes, and the affine transform is cached per
+        (angle, axes, volume_shape), so repeated visualizations reuse it.
+        On the GPU, linear float32 rotations use hardware texture interpolation.
+        The output is written to a buffer reused across calls, so the returned
+        array is only valid until the next call.
+
+        Parameters
+        ----------
+        volume_array: np.ndarray
+            Volume, or stack of volumes, to rotate
+        angle_deg: float
+            Rotation angle in degrees
+        axes: tuple(int,int)
+            Axes defining the rotation plane
+        order: int, optional
+            Spline interpolation order, linear by default
+
+        Returns
+        -------
+        rotated_volume: np.ndarray
+            Rotated volume
+        """
+        xp = self._xp
+        affine_transform = self._affine_transform
+
+        volume_shape = volume_array.shape[-3:]
+        texture_memory = (
+            xp is not np
+            and not cp.cuda.runtime.is_hip
+            and order == 1
+            and volume_array.dtype == xp.float32
+        )
+        key = (
+            "projection",
+            angle_deg,
+            tuple(axes),
+            tuple(volume_shape),
+            texture_memory,
+        )
+
+        if key not in self._rotation_matrices_cache:
+            rotation_matrix = self._plane_rotation_matrix(angle_deg, axes)
+            center = (np.array(volume_shape) - 1) / 2
+            offset = center - rotation_matrix @ center
+
+            if texture_memory:
+                # texture interpolation takes a homogeneous float32 transform
+                homogeneous_matrix = np.eye(4, dtype=np.float32)
+                homogeneous_matrix[:3, :3] = rotation_matrix
+                homogeneous_matrix[:3, 3] = offset
+                self._rotation_matrices_cache[key] = (
+                    xp.asarray(homogeneous_matrix),
+                    0.0,
+                )
+            else:
+                self._rotation_matrices_cache[key] = (
+                    xp.asarray(rotation_matrix),
+                    tuple(offset),
+                )
+
+        rotation_matrix, offset = self._rotation_matrices_cache[key]
+
+        def rotate_volume(volume_in, volume_out):
+            if texture_memory:
+                affine_transform(
+                    volume_in,
+                    rotation_matrix,
+                    output=volume_out,
+                    order=order,
+                    texture_memory=True,
+                )
+            else:
+                affine_transform(
+                    volume_in,
+                    rotation_matrix,
+                    offset,
+                    output=volume_out,
+                    order=order,
+                )
+
+        volume = self._projection_rotation_buffer
+        if (
+            volume is None
+            or volume.shape != volume_array.shape
+            or volume.dtype != volume_array.dtype
+        ):
+            volume = xp.empty_like(volume_array)
+            self._projection_rotation_buffer = volume
+
+        volumes_in = volume_array.reshape((-1,) + volume_shape)
+        volumes_out = volume.reshape((-1,) + volume_shape)
+
+        if xp is np and len(volumes_in) > 1:
+            # scipy.ndimage releases the GIL, so stacked volumes rotate concurrently
+            with ThreadPoolExecutor(max_workers=len(volumes_in)) as executor:
+                list(executor.map(rotate_volume, volumes_in, volumes_out))
+        else:
+            for volume_in, volume_out in zip(volumes_in, volumes_out):
+                rotate_volume(volume_in, volume_out)
+
+        return volume
 
     def _euler_angle_rotate_volume(
         self,
         volume_array,
         alpha_deg,
         beta_deg,
+        spline_coefficients=None,
     ):
         """
         Rotate 3D volume using alpha, beta, gamma Euler angles according to convention:
@@ -332,83 +515,81 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
         - \alpha tilt around first axis (z)
 
         Note: since we store array as zxy, the x- and y-axis rotations flip sign below.
+        Rotations act on the last three axes, so a stack of volumes with leading
+        dimensions (e.g. the (4,Px,Py,Py) object) is rotated in a single call.
+        The three rotations are composed into a single cached affine transform.
+        For beta = 0 the composition is the identity, and volume_array is
+        returned as-is, without a copy.
+        If volume_array is rotated repeatedly, its cubic spline_coefficients (see
+        _volume_spline_coefficients) can be passed to skip the spline prefilter.
 
         """
 
-        rotate = self._rotate
-        volume = volume_array.copy()
+        xp = self._xp
+        affine_transform = self._affine_transform
 
         alpha_deg, beta_deg = np.mod(np.array([alpha_deg, beta_deg]) + 180, 360) - 180
 
-        if alpha_deg == -180:
-            # print(f"rotation of {-beta_deg} around x")
-            volume = rotate(
-                volume,
-                beta_deg,
-                axes=(0, 2),
-                reshape=False,
-                order=3,
-            )
-        elif alpha_deg == -90:
-            # print(f"rotation of {beta_deg} around y")
-            volume = rotate(
-                volume,
-                -beta_deg,
-                axes=(0, 1),
-                reshape=False,
-                order=3,
-            )
-        elif alpha_deg == 0:
-            # print(f"rotation of {beta_deg} around x")
-            volume = rotate(
-                volume,
-                -beta_deg,
-                axes=(0, 2),
-                reshape=False,
-                order=3,
-            )
-        elif alpha_deg == 90:
-            # print(f"rotation of {-beta_deg} around y")
-            volume = rotate(
-                volume,
-                beta_deg,
-                axes=(0, 1),
-                reshape=False,
-                order=3,
-            )
-        else:
-            # print((
-            #     f"rotation of {-alpha_deg} around z, "
-            #     f"rotation of {beta_deg} around x, "
-            #     f"rotation of {alpha_deg} around z."
-            # ))
-
-            volume = rotate(
-                volume,
-                -alpha_deg,
-                axes=(1, 2),
-                reshape=False,
-                order=3,
-            )
+        # -alpha and alpha cancel without a beta tilt
+        if beta_deg == 0:
+            return volume_array
 
-            volume = rotate(
-                volume,
-                -beta_deg,
-                axes=(0, 2),
-                reshape=False,
-                order=3,
-            )
+        volume_shape = volume_array.shape[-3:]
+        rotation_matrix, offset = self._euler_angle_rotation_matrix(
+            alpha_deg, beta_deg, volume_shape
+        )
 
-            volume = rotate(
-                volume,
-                alpha_deg,
-                axes=(1, 2),
-                reshape=False,
+        prefilter = spline_coefficients is None
+        if prefilter:
+            spline_coefficients = volume_array
+
+        volume = xp.empty_like(volume_array)
+        for volume_in, volume_out in zip(
+            spline_coefficients.reshape((-1,) + volume_shape),
+            volume.reshape((-1,) + volume_shape),
+        ):
+            affine_transform(
+                volume_in,
+                rotation_matrix,
+                offset,
+                output=volume_out,
                 order=3,
+                prefilter=prefilter,
             )
 
         return volume
 
+    def _volume_spline_coefficients(self, volume_array, output=None):
+        """
+        Computes the cubic spline coefficients of each volume along the last three
+        axes, as used by _euler_angle_rotate_volume.
+
+        Parameters
+        ----------
+        volume_array: np.ndarray
+            Volume, or stack of volumes, to filter
+        output: np.ndarray, optional
+            Array to store the coefficients in
+
+        Returns
+        -------
+        spline_coefficients: np.ndarray
+            Cubic spline coefficients of volume_array
+        """
+        xp = self._xp
+
+        if output is None:
+            output = xp.empty_like(volume_array)
+
+        volume_shape = volume_array.shape[-3:]
+        for volume_in, volume_out in zip(
+            volume_array.reshape((-1,) + volume_shape),
+            output.reshape((-1,) + volume_shape),
+        ):
+            self._spline_filter(volume_in, order=3, output=volume_out)
+
+        return output
+
     def preprocess(
         self,
         diffraction_intensities_shape: Tuple[int, int] = None,
@@ -526,7 +707,8 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
                 )
 
                 self._amplitudes = xp.empty(
-                    (self._num_diffraction_patterns,) + self._datacube[0].Qshape
+                    (self._num_diffraction_patterns,) + self._datacube[0].Qshape,
+                    dtype=xp.float32,
                 )
                 self._region_of_interest_shape = np.array(
                     self._amplitudes[0].shape[-2:]
@@ -612,7 +794,17 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
             )
             self._object = xp.zeros((4, q, p, q), dtype=xp.float32)
         else:
-            self._object = xp.asarray(self._object, dtype=xp.float32)
+            # (V, Az, Ax, Ay) stored as a single contiguous array
+            self._object = xp.ascontiguousarray(
+                xp.asarray(self._object, dtype=xp.float32)
+            )
+            if self._object.ndim != 4 or self._object.shape[0] != 4:
+                raise ValueError(
+                    (
+                        "initial_object_guess must have dimensions (4,Px,Py,Py), "
+                        f"not {self._object.shape}"
+                    )
+                )
 
         self._object_initial = self._object.copy()
         self._object_type_initial = self._object_type
@@ -707,6 +899,8 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
             else:
                 self._probe = xp.asarray(self._probe, dtype=xp.complex64)
 
+        # keep the probe in single precision, however it was provided
+        self._probe = self._probe.astype(xp.complex64, copy=False)
         self._probe_initial = self._probe.copy()
 
         self._known_aberrations_array = ComplexProbe(
@@ -730,6 +924,7 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
             self._energy,
             self._slice_thicknesses,
         )
+        self._propagator_arrays_conj = xp.conj(self._propagator_arrays)
 
         # overlaps
         if object_fov_mask is None:
@@ -914,9 +1109,11 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
 
         xp = self._xp
 
-        complex_object = xp.exp(1j * (current_object_V + current_object_A_projected))
-        object_patches = complex_object[
-            :, self._vectorized_patch_indices_row, self._vectorized_patch_indices_col
+        complex_object = complex_exponential(
+            current_object_V + current_object_A_projected, xp
+        )
+        object_patches = complex_object.reshape(self._num_slices, -1)[
+            :, self._vectorized_patch_indices_linear
         ]
 
         propagated_probes = xp.empty_like(object_patches)
@@ -956,12 +1153,12 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
         """
 
         xp = self._xp
-        fourier_exit_waves = xp.fft.fft2(transmitted_probes)
+        fourier_exit_waves = self._fft2(transmitted_probes)
 
         error = xp.sum(xp.abs(amplitudes - xp.abs(fourier_exit_waves)) ** 2)
 
-        modified_exit_wave = xp.fft.ifft2(
-            amplitudes * xp.exp(1j * xp.angle(fourier_exit_waves))
+        modified_exit_wave = self._ifft2(
+            phase_replace(fourier_exit_waves, amplitudes, xp)
         )
 
         exit_waves = modified_exit_wave - transmitted_probes
@@ -1019,24 +1216,29 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
         if exit_waves is None:
             exit_waves = transmitted_probes.copy()
 
-        fourier_exit_waves = xp.fft.fft2(transmitted_probes)
+        fourier_exit_waves = self._fft2(transmitted_probes)
         error = xp.sum(xp.abs(amplitudes - xp.abs(fourier_exit_waves)) ** 2)
 
         factor_to_be_projected = (
             projection_c * transmitted_probes + projection_y * exit_waves
         )
-        fourier_projected_factor = xp.fft.fft2(factor_to_be_projected)
+        fourier_projected_factor = self._fft2(factor_to_be_projected)
 
-        fourier_projected_factor = amplitudes * xp.exp(
-            1j * xp.angle(fourier_projected_factor)
-        )
-        projected_factor = xp.fft.ifft2(fourier_projected_factor)
-
-        exit_waves = (
-            projection_x * exit_waves
-            + projection_a * transmitted_probes
-            + projection_b * projected_factor
+        fourier_projected_factor = phase_replace(
+            fourier_projected_factor, amplitudes, xp
         )
+        projected_factor = self._ifft2(fourier_projected_factor)
+
+        # update the stored exit waves in-place to avoid re-allocating them,
+        # skipping trivial coefficients (e.g. a=0 for SUPERFLIP, x=1 for RRR)
+        if projection_x != 1:
+            exit_waves *= projection_x
+        if projection_a != 0:
+            exit_waves += projection_a * transmitted_probes
+        if projection_b == 1:
+            exit_waves += projected_factor
+        else:
+            exit_waves += projection_b * projected_factor
 
         return exit_waves, error
 
@@ -1196,7 +1398,7 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
             if s > 0:
                 # back-propagate
                 exit_waves = self._propagate_array(
-                    exit_waves, xp.conj(self._propagator_arrays[s - 1])
+                    exit_waves, self._propagator_arrays_conj[s - 1]
                 )
             elif not fix_probe:
                 # probe-update
@@ -1267,7 +1469,16 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
         xp = self._xp
 
         # careful not to modify exit_waves in-place for projection set methods
-        exit_waves_copy = exit_waves.copy()
+        # reuse a scratch buffer across calls within reconstruct
+        if (
+            self._exit_waves_scratch is None
+            or self._exit_waves_scratch.shape != exit_waves.shape
+            or self._exit_waves_scratch.dtype != exit_waves.dtype
+        ):
+            self._exit_waves_scratch = xp.empty_like(exit_waves)
+
+        exit_waves_copy = self._exit_waves_scratch
+        xp.copyto(exit_waves_copy, exit_waves)
         for s in reversed(range(self._num_slices)):
             probe = propagated_probes[s]
             obj = object_patches[s]
@@ -1298,7 +1509,7 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
             if s > 0:
                 # back-propagate
                 exit_waves_copy = self._propagate_array(
-                    exit_waves_copy, xp.conj(self._propagator_arrays[s - 1])
+                    exit_waves_copy, self._propagator_arrays_conj[s - 1]
                 )
 
             elif not fix_probe:
@@ -1447,7 +1658,7 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
         xp = self._xp
 
         # Intensity gradient
-        exit_waves_fft = xp.fft.fft2(transmitted_probes[-1])
+        exit_waves_fft = self._fft2(transmitted_probes[-1])
         exit_waves_fft_conj = xp.conj(exit_waves_fft)
         estimated_intensity = xp.abs(exit_waves_fft) ** 2
         measured_intensity = amplitudes**2
@@ -1459,14 +1670,17 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
 
         # Computing perturbed exit waves one at a time to save on memory
 
-        complex_object = xp.exp(1j * current_object)
+        complex_object = complex_exponential(current_object, xp).reshape(
+            self._num_slices, -1
+        )
 
         # dx
         propagated_probes = fft_shift(current_probe, self._positions_px_fractional, xp)
         obj_rolled_patches = complex_object[
             :,
-            (self._vectorized_patch_indices_row + 1) % self._object_shape[0],
-            self._vectorized_patch_indices_col,
+            ((self._vectorized_patch_indices_row + 1) % self._object_shape[0])
+            * self._object_shape[1]
+            + self._vectorized_patch_indices_col,
         ]
 
         transmitted_probes_perturbed = xp.empty_like(obj_rolled_patches)
@@ -1481,7 +1695,7 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
                     transmitted_probes_perturbed[s], self._propagator_arrays[s]
                 )
 
-        exit_waves_dx_fft = exit_waves_fft - xp.fft.fft2(
+        exit_waves_dx_fft = exit_waves_fft - self._fft2(
             transmitted_probes_perturbed[-1]
         )
 
@@ -1489,8 +1703,8 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
         propagated_probes = fft_shift(current_probe, self._positions_px_fractional, xp)
         obj_rolled_patches = complex_object[
             :,
-            self._vectorized_patch_indices_row,
-            (self._vectorized_patch_indices_col + 1) % self._object_shape[1],
+            self._vectorized_patch_indices_row * self._object_shape[1]
+            + (self._vectorized_patch_indices_col + 1) % self._object_shape[1],
         ]
 
         transmitted_probes_perturbed = xp.empty_like(obj_rolled_patches)
@@ -1505,7 +1719,7 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
                     transmitted_probes_perturbed[s], self._propagator_arrays[s]
                 )
 
-        exit_waves_dy_fft = exit_waves_fft - xp.fft.fft2(
+        exit_waves_dy_fft = exit_waves_fft - self._fft2(
             transmitted_probes_perturbed[-1]
         )
 
@@ -1518,27 +1732,16 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
 
         coefficients_matrix = xp.dstack((partial_intensity_dx, partial_intensity_dy))
 
-        # positions_update = xp.einsum(
-        #    "idk,ik->id", xp.linalg.pinv(coefficients_matrix), difference_intensity
-        # )
-
-        coefficients_matrix_T = coefficients_matrix.conj().swapaxes(-1, -2)
-        positions_update = (
-            xp.linalg.inv(coefficients_matrix_T @ coefficients_matrix)
-            @ coefficients_matrix_T
-            @ difference_intensity[..., None]
+        positions_update = solve_position_updates(
+            coefficients_matrix, difference_intensity, xp
         )
 
         if constrain_position_distance is not None:
             constrain_position_distance /= xp.sqrt(
                 self.sampling[0] ** 2 + self.sampling[1] ** 2
             )
-            x1 = (current_positions - positions_step_size * positions_update[..., 0])[
-                :, 0
-            ]
-            y1 = (current_positions - positions_step_size * positions_update[..., 0])[
-                :, 1
-            ]
+            x1 = (current_positions - positions_step_size * positions_update)[:, 0]
+            y1 = (current_positions - positions_step_size * positions_update)[:, 1]
             x0 = self._positions_px_initial[:, 0]
             y0 = self._positions_px_initial[:, 1]
             if self._rotation_best_transpose:
@@ -1560,9 +1763,9 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
                 y1 < (xp.min(y0) - constrain_position_distance)
             ) > 0
 
-            positions_update[..., 0][outlier_ind] = 0
+            positions_update[outlier_ind] = 0
 
-        current_positions -= positions_step_size * positions_update[..., 0]
+        current_positions -= positions_step_size * positions_update
 
         return current_positions
 
@@ -1571,6 +1774,9 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
         Ptychographic smoothness constraint.
         Used for blurring object.
 
+        Filtering is performed in Fourier space over the last three axes, so a stack
+        of volumes (e.g. the three magnetic components) is filtered at once.
+
         Parameters
         --------
         current_object: np.ndarray
@@ -1583,18 +1789,36 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
         constrained_object: np.ndarray
             Constrained object estimate
         """
-        gaussian_filter = self._gaussian_filter
         xp = self._xp
 
-        gaussian_filter_sigma /= xp.sqrt(self.sampling[0] ** 2 + self.sampling[1] ** 2)
-        current_object = gaussian_filter(current_object, gaussian_filter_sigma)
+        gaussian_filter_sigma /= np.sqrt(self.sampling[0] ** 2 + self.sampling[1] ** 2)
+
+        volume_shape = current_object.shape[-3:]
+        key = (gaussian_filter_sigma, volume_shape)
+
+        if key not in self._gaussian_kernels_cache:
+            kz = xp.fft.fftfreq(volume_shape[0]).astype(xp.float32)
+            kx = xp.fft.fftfreq(volume_shape[1]).astype(xp.float32)
+            ky = xp.fft.rfftfreq(volume_shape[2]).astype(xp.float32)
+            kza, kxa, kya = xp.meshgrid(kz, kx, ky, indexing="ij")
+            kra2 = kza**2 + kxa**2 + kya**2
+
+            self._gaussian_kernels_cache[key] = xp.exp(
+                -2 * np.pi**2 * gaussian_filter_sigma**2 * kra2
+            ).astype(xp.float32)
+
+        current_object_fft = xp.fft.rfftn(current_object, axes=(-3, -2, -1))
+        current_object_fft *= self._gaussian_kernels_cache[key]
 
-        return current_object
+        return xp.fft.irfftn(current_object_fft, s=volume_shape, axes=(-3, -2, -1))
 
     def _object_butterworth_constraint(self, current_object, q_lowpass, q_highpass):
         """
         Butterworth filter
 
+        Filtering is performed over the last three axes, so a stack of volumes
+        (e.g. the three magnetic components) is filtered at once.
+
         Parameters
         --------
         current_object: np.ndarray
@@ -1610,20 +1834,30 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
             Constrained object estimate
         """
         xp = self._xp
-        qz = xp.fft.fftfreq(current_object.shape[0], self.sampling[1])
-        qx = xp.fft.fftfreq(current_object.shape[1], self.sampling[0])
-        qy = xp.fft.fftfreq(current_object.shape[2], self.sampling[1])
-        qza, qxa, qya = xp.meshgrid(qz, qx, qy, indexing="ij")
-        qra = xp.sqrt(qza**2 + qxa**2 + qya**2)
 
-        env = xp.ones_like(qra)
-        if q_highpass:
-            env *= 1 - 1 / (1 + (qra / q_highpass) ** 4)
-        if q_lowpass:
-            env *= 1 / (1 + (qra / q_lowpass) ** 4)
+        volume_shape = current_object.shape[-3:]
+        key = (q_lowpass, q_highpass, volume_shape)
+
+        if key not in self._butterworth_kernels_cache:
+            qz = xp.fft.fftfreq(volume_shape[0], self.sampling[1]).astype(xp.float32)
+            qx = xp.fft.fftfreq(volume_shape[1], self.sampling[0]).astype(xp.float32)
+            qy = xp.fft.rfftfreq(volume_shape[2], self.sampling[1]).astype(xp.float32)
+            qza, qxa, qya = xp.meshgrid(qz, qx, qy, indexing="ij")
+            qra = xp.sqrt(qza**2 + qxa**2 + qya**2)
+
+            # object is real, so only the non-redundant half-spectrum is needed
+            env = xp.ones_like(qra)
+            if q_highpass:
+                env *= 1 - 1 / (1 + (qra / q_highpass) ** 4)
+            if q_lowpass:
+                env *= 1 / (1 + (qra / q_lowpass) ** 4)
+
+            self._butterworth_kernels_cache[key] = env
 
-        current_object = xp.fft.ifftn(xp.fft.fftn(current_object) * env)
-        return xp.real(current_object)
+        current_object_fft = xp.fft.rfftn(current_object, axes=(-3, -2, -1))
+        current_object_fft *= self._butterworth_kernels_cache[key]
+
+        return xp.fft.irfftn(current_object_fft, s=volume_shape, axes=(-3, -2, -1))
 
     def _divergence_free_constraint(self, vector_field):
         """
@@ -1747,14 +1981,8 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
             current_object[0] = self._object_gaussian_constraint(
                 current_object[0], gaussian_filter_sigma_e
             )
-            current_object[1] = self._object_gaussian_constraint(
-                current_object[1], gaussian_filter_sigma_m
-            )
-            current_object[2] = self._object_gaussian_constraint(
-                current_object[2], gaussian_filter_sigma_m
-            )
-            current_object[3] = self._object_gaussian_constraint(
-                current_object[3], gaussian_filter_sigma_m
+            current_object[1:] = self._object_gaussian_constraint(
+                current_object[1:], gaussian_filter_sigma_m
             )
 
         if butterworth_filter:
@@ -1763,18 +1991,8 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
                 q_lowpass_e,
                 q_highpass_e,
             )
-            current_object[1] = self._object_butterworth_constraint(
-                current_object[1],
-                q_lowpass_m,
-                q_highpass_m,
-            )
-            current_object[2] = self._object_butterworth_constraint(
-                current_object[2],
-                q_lowpass_m,
-                q_highpass_m,
-            )
-            current_object[3] = self._object_butterworth_constraint(
-                current_object[3],
+            current_object[1:] = self._object_butterworth_constraint(
+                current_object[1:],
                 q_lowpass_m,
                 q_highpass_m,
             )
@@ -2096,6 +2314,10 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
         if max_batch_size is not None:
             xp.random.seed(seed_random)
 
+        # tilt and probe orderings are shuffled on the host, with a local
+        # generator so the global numpy random state is left untouched
+        rng = np.random.default_rng(seed_random)
+
         # initialization
         if store_iterations and (not hasattr(self, "object_iterations") or reset):
             self.object_iterations = []
@@ -2104,6 +2326,7 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
         if reset:
             self._object = self._object_initial.copy()
             self.error_iterations = []
+            self._exit_waves_scratch = None
             self._probe = self._probe_initial.copy()
             self._positions_px_all = self._positions_px_initial_all.copy()
 
@@ -2134,6 +2357,22 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
         if q_lowpass_m is None:
             q_lowpass_m = q_lowpass_e
 
+        if collective_tilt_updates:
+            collective_object = xp.empty_like(self._object)
+            object_spline_coefficients = xp.empty_like(self._object)
+        else:
+            object_spline_coefficients = None
+
+        # per-iteration errors, kept on device and transferred once at the end
+        errors = xp.empty(max_iter)
+
+        # index buffers, shuffled in-place every iteration
+        tilt_indices = np.arange(self._num_tilts)
+        shuffled_indices_per_tilt = [
+            np.arange(num_diffraction_patterns)
+            for num_diffraction_patterns in np.diff(self._cum_probes_per_tilt)
+        ]
+
         # main loop
         for a0 in tqdmnd(
             max_iter,
@@ -2144,10 +2383,14 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
             error = 0.0
 
             if collective_tilt_updates:
-                collective_object = xp.zeros_like(self._object)
+                collective_object.fill(0.0)
+
+                # the object is fixed across tilts, so it is prefiltered only once
+                self._volume_spline_coefficients(
+                    self._object, output=object_spline_coefficients
+                )
 
-            tilt_indices = np.arange(self._num_tilts)
-            np.random.shuffle(tilt_indices)
+            rng.shuffle(tilt_indices)
 
             for tilt_index in tilt_indices:
                 tilt_error = 0.0
@@ -2156,40 +2399,29 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
                 alpha_deg, beta_deg = self._tilt_angles_deg[self._active_tilt_index]
                 alpha, beta = np.deg2rad([alpha_deg, beta_deg])
 
-                # V
-                self._object[0] = self._euler_angle_rotate_volume(
-                    self._object[0],
-                    alpha_deg,
-                    beta_deg,
-                )
-
-                # Az
-                self._object[1] = self._euler_angle_rotate_volume(
-                    self._object[1],
-                    alpha_deg,
-                    beta_deg,
-                )
-
-                # Ax
-                self._object[2] = self._euler_angle_rotate_volume(
-                    self._object[2],
+                # V, Az, Ax, Ay
+                rotated_object = self._euler_angle_rotate_volume(
+                    self._object,
                     alpha_deg,
                     beta_deg,
+                    spline_coefficients=object_spline_coefficients,
                 )
 
-                # Ay
-                self._object[3] = self._euler_angle_rotate_volume(
-                    self._object[3],
-                    alpha_deg,
-                    beta_deg,
+                # projection of (Az, Ax, Ay) onto the beam direction
+                magnetic_coefficients = xp.asarray(
+                    (
+                        np.cos(beta),
+                        -np.sin(alpha) * np.sin(beta),
+                        np.cos(alpha) * np.sin(beta),
+                    ),
+                    dtype=xp.float32,
                 )
-
-                object_A = self._object[1] * np.cos(beta) + np.sin(beta) * (
-                    self._object[3] * np.cos(alpha) - self._object[2] * np.sin(alpha)
+                object_A = xp.tensordot(
+                    magnetic_coefficients, rotated_object[1:], axes=1
                 )
 
                 object_sliced_V = self._project_sliced_object(
-                    self._object[0], self._num_slices
+                    rotated_object[0], self._num_slices
                 )
 
                 object_sliced_A = self._project_sliced_object(
@@ -2204,8 +2436,7 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
                 end_tilt = self._cum_probes_per_tilt[self._active_tilt_index + 1]
 
                 num_diffraction_patterns = end_tilt - start_tilt
-                shuffled_indices = np.arange(num_diffraction_patterns)
-                unshuffled_indices = np.zeros_like(shuffled_indices)
+                shuffled_indices = shuffled_indices_per_tilt[self._active_tilt_index]
 
                 if max_batch_size is None:
                     current_max_batch_size = num_diffraction_patterns
@@ -2214,18 +2445,20 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
 
                 # randomize
                 if not use_projection_scheme:
-                    np.random.shuffle(shuffled_indices)
+                    rng.shuffle(shuffled_indices)
 
-                unshuffled_indices[shuffled_indices] = np.arange(
-                    num_diffraction_patterns
-                )
+                # uploaded once per tilt, rather than with every batch gather
+                shuffled_indices = xp.asarray(shuffled_indices)
 
-                positions_px = self._positions_px_all[start_tilt:end_tilt].copy()[
+                # fancy-indexing already returns copies
+                positions_px = self._positions_px_all[start_tilt:end_tilt][
                     shuffled_indices
                 ]
                 initial_positions_px = self._positions_px_initial_all[
                     start_tilt:end_tilt
-                ].copy()[shuffled_indices]
+                ][shuffled_indices]
+                tilt_amplitudes = self._amplitudes[start_tilt:end_tilt]
+                fix_probe = a0 < fix_probe_iter
 
                 for start, end in generate_batches(
                     num_diffraction_patterns, max_batch=current_max_batch_size
@@ -2234,18 +2467,28 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
                     self._positions_px = positions_px[start:end]
                     self._positions_px_initial = initial_positions_px[start:end]
                     self._positions_px_com = xp.mean(self._positions_px, axis=0)
-                    self._positions_px_fractional = self._positions_px - xp.round(
-                        self._positions_px
+                    positions_px_rounded = xp.round(self._positions_px)
+                    self._positions_px_fractional = (
+                        self._positions_px - positions_px_rounded
                     )
 
                     (
                         self._vectorized_patch_indices_row,
                         self._vectorized_patch_indices_col,
-                    ) = self._extract_vectorized_patch_indices()
+                    ) = self._extract_vectorized_patch_indices(positions_px_rounded)
 
-                    amplitudes = self._amplitudes[start_tilt:end_tilt][
-                        shuffled_indices[start:end]
-                    ]
+                    # flat indices turn the 2D fancy-index into a single gather
+                    self._vectorized_patch_indices_linear = (
+                        self._vectorized_patch_indices_row.astype(xp.int32)
+                        * self._object_shape[1]
+                        + self._vectorized_patch_indices_col.astype(xp.int32)
+                    )
+
+                    if use_projection_scheme:
+                        # unshuffled, so a view avoids gathering a copy
+                        amplitudes = tilt_amplitudes[start:end]
+                    else:
+                        amplitudes = tilt_amplitudes[shuffled_indices[start:end]]
 
                     # forward operator
                     (
@@ -2277,7 +2520,7 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
                         use_projection_scheme=use_projection_scheme,
                         step_size=step_size,
                         normalization_min=normalization_min,
-                        fix_probe=a0 < fix_probe_iter,
+                        fix_probe=fix_probe,
                     )
 
                     # position correction
@@ -2306,55 +2549,27 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
                 )
 
                 if collective_tilt_updates:
-                    collective_object[0] += self._euler_angle_rotate_volume(
-                        object_update_V,
+                    # rotation is linear, so A is rotated once and scaled per component
+                    rotated_updates = self._euler_angle_rotate_volume(
+                        xp.stack((object_update_V, object_update_A)),
                         alpha_deg,
                         -beta_deg,
                     )
-                    collective_object[1] += self._euler_angle_rotate_volume(
-                        object_update_A * np.cos(beta),
-                        alpha_deg,
-                        -beta_deg,
+                    collective_object[0] += rotated_updates[0]
+                    collective_object[1:] += (
+                        magnetic_coefficients[:, None, None, None] * rotated_updates[1]
                     )
-                    collective_object[2] -= self._euler_angle_rotate_volume(
-                        object_update_A * np.sin(alpha) * np.sin(beta),
-                        alpha_deg,
-                        -beta_deg,
+                else:
+                    rotated_object[0] += object_update_V
+                    rotated_object[1:] += (
+                        magnetic_coefficients[:, None, None, None] * object_update_A
                     )
-                    collective_object[3] += self._euler_angle_rotate_volume(
-                        object_update_A * np.cos(alpha) * np.sin(beta),
+
+                    self._object = self._euler_angle_rotate_volume(
+                        rotated_object,
                         alpha_deg,
                         -beta_deg,
                     )
-                else:
-                    self._object[0] += object_update_V
-                    self._object[1] += object_update_A * np.cos(beta)
-                    self._object[2] -= object_update_A * np.sin(alpha) * np.sin(beta)
-                    self._object[3] += object_update_A * np.cos(alpha) * np.sin(beta)
-
-                self._object[0] = self._euler_angle_rotate_volume(
-                    self._object[0],
-                    alpha_deg,
-                    -beta_deg,
-                )
-
-                self._object[1] = self._euler_angle_rotate_volume(
-                    self._object[1],
-                    alpha_deg,
-                    -beta_deg,
-                )
-
-                self._object[2] = self._euler_angle_rotate_volume(
-                    self._object[2],
-                    alpha_deg,
-                    -beta_deg,
-                )
-
-                self._object[3] = self._euler_angle_rotate_volume(
-                    self._object[3],
-                    alpha_deg,
-                    -beta_deg,
-                )
 
                 # Normalize Error
                 tilt_error /= (
@@ -2364,54 +2579,26 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
                 error += tilt_error
 
                 # constraints
-                self._positions_px_all[start_tilt:end_tilt] = positions_px.copy()[
-                    unshuffled_indices
-                ]
-
-                if not collective_tilt_updates:
-                    (
-                        self._object,
-                        self._probe,
-                        self._positions_px_all[start_tilt:end_tilt],
-                    ) = self._constraints(
-                        self._object,
-                        self._probe,
-                        self._positions_px_all[start_tilt:end_tilt],
-                        fix_com=fix_com and a0 >= fix_probe_iter,
-                        symmetrize_probe=a0 < symmetrize_probe_iter,
-                        probe_gaussian_filter=a0
-                        < probe_gaussian_filter_residual_aberrations_iter
-                        and probe_gaussian_filter_sigma is not None,
-                        probe_gaussian_filter_sigma=probe_gaussian_filter_sigma,
-                        probe_gaussian_filter_fix_amplitude=probe_gaussian_filter_fix_amplitude,
-                        fix_probe_amplitude=a0 < fix_probe_amplitude_iter
-                        and a0 >= fix_probe_iter,
-                        fix_probe_amplitude_relative_radius=fix_probe_amplitude_relative_radius,
-                        fix_probe_amplitude_relative_width=fix_probe_amplitude_relative_width,
-                        fix_probe_fourier_amplitude=a0
-                        < fix_probe_fourier_amplitude_iter
-                        and a0 >= fix_probe_iter,
-                        fix_probe_fourier_amplitude_threshold=fix_probe_fourier_amplitude_threshold,
-                        fix_positions=a0 < fix_positions_iter,
-                        global_affine_transformation=global_affine_transformation,
-                        gaussian_filter=a0 < gaussian_filter_iter
-                        and gaussian_filter_sigma_m is not None,
-                        gaussian_filter_sigma_e=gaussian_filter_sigma_e,
-                        gaussian_filter_sigma_m=gaussian_filter_sigma_m,
-                        butterworth_filter=a0 < butterworth_filter_iter
-                        and (q_lowpass_m is not None or q_highpass_m is not None),
-                        q_lowpass_e=q_lowpass_e,
-                        q_lowpass_m=q_lowpass_m,
-                        q_highpass_e=q_highpass_e,
-                        q_highpass_m=q_highpass_m,
-                        object_positivity=object_positivity,
-                        shrinkage_rad=shrinkage_rad,
-                        object_mask=self._object_fov_mask_inverse
-                        if fix_potential_baseline
-                        and self._object_fov_mask_inverse.sum() > 0
-                        else None,
+                self._positions_px_all[start_tilt:end_tilt][
+                    shuffled_indices
+                ] = positions_px
+
+                # collective tilt updates never constrain the positions
+                if not collective_tilt_updates and a0 >= fix_positions_iter:
+                    self._positions_px_all[
+                        start_tilt:end_tilt
+                    ] = self._positions_center_of_mass_constraint(
+                        self._positions_px_all[start_tilt:end_tilt]
                     )
 
+                    if global_affine_transformation:
+                        self._positions_px_all[
+                            start_tilt:end_tilt
+                        ] = self._positions_affine_transformation_constraint(
+                            self._positions_px_initial,
+                            self._positions_px_all[start_tilt:end_tilt],
+                        )
+
             # Normalize Error Over Tilts
             error /= self._num_tilts
 
@@ -2420,48 +2607,58 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
             if collective_tilt_updates:
                 self._object += collective_object / self._num_tilts
 
-                (self._object, self._probe, _,) = self._constraints(
-                    self._object,
-                    self._probe,
-                    None,
-                    fix_com=fix_com and a0 >= fix_probe_iter,
-                    symmetrize_probe=a0 < symmetrize_probe_iter,
-                    probe_gaussian_filter=a0
-                    < probe_gaussian_filter_residual_aberrations_iter
-                    and probe_gaussian_filter_sigma is not None,
-                    probe_gaussian_filter_sigma=probe_gaussian_filter_sigma,
-                    probe_gaussian_filter_fix_amplitude=probe_gaussian_filter_fix_amplitude,
-                    fix_probe_amplitude=a0 < fix_probe_amplitude_iter
-                    and a0 >= fix_probe_iter,
-                    fix_probe_amplitude_relative_radius=fix_probe_amplitude_relative_radius,
-                    fix_probe_amplitude_relative_width=fix_probe_amplitude_relative_width,
-                    fix_probe_fourier_amplitude=a0 < fix_probe_fourier_amplitude_iter
-                    and a0 >= fix_probe_iter,
-                    fix_probe_fourier_amplitude_threshold=fix_probe_fourier_amplitude_threshold,
-                    fix_positions=True,
-                    global_affine_transformation=global_affine_transformation,
-                    gaussian_filter=a0 < gaussian_filter_iter
-                    and gaussian_filter_sigma_m is not None,
-                    gaussian_filter_sigma_e=gaussian_filter_sigma_e,
-                    gaussian_filter_sigma_m=gaussian_filter_sigma_m,
-                    butterworth_filter=a0 < butterworth_filter_iter
-                    and (q_lowpass_m is not None or q_highpass_m is not None),
-                    q_lowpass_e=q_lowpass_e,
-                    q_lowpass_m=q_lowpass_m,
-                    q_highpass_e=q_highpass_e,
-                    q_highpass_m=q_highpass_m,
-                    object_positivity=object_positivity,
-                    shrinkage_rad=shrinkage_rad,
-                    object_mask=self._object_fov_mask_inverse
-                    if fix_potential_baseline
-                    and self._object_fov_mask_inverse.sum() > 0
-                    else None,
-                )
-
-            self.error_iterations.append(error.item())
+            # constraints, applied once per iteration rather than once per tilt
+            (self._object, self._probe, _,) = self._constraints(
+                self._object,
+                self._probe,
+                None,
+                fix_com=fix_com and a0 >= fix_probe_iter,
+                symmetrize_probe=a0 < symmetrize_probe_iter,
+                probe_gaussian_filter=a0
+                < probe_gaussian_filter_residual_aberrations_iter
+                and probe_gaussian_filter_sigma is not None,
+                probe_gaussian_filter_sigma=probe_gaussian_filter_sigma,
+                probe_gaussian_filter_fix_amplitude=probe_gaussian_filter_fix_amplitude,
+                fix_probe_amplitude=a0 < fix_probe_amplitude_iter
+                and a0 >= fix_probe_iter,
+                fix_probe_amplitude_relative_radius=fix_probe_amplitude_relative_radius,
+                fix_probe_amplitude_relative_width=fix_probe_amplitude_relative_width,
+                fix_probe_fourier_amplitude=a0 < fix_probe_fourier_amplitude_iter
+                and a0 >= fix_probe_iter,
+                fix_probe_fourier_amplitude_threshold=fix_probe_fourier_amplitude_threshold,
+                fix_positions=True,
+                global_affine_transformation=global_affine_transformation,
+                gaussian_filter=a0 < gaussian_filter_iter
+                and gaussian_filter_sigma_m is not None,
+                gaussian_filter_sigma_e=gaussian_filter_sigma_e,
+                gaussian_filter_sigma_m=gaussian_filter_sigma_m,
+                butterworth_filter=a0 < butterworth_filter_iter
+                and (q_lowpass_m is not None or q_highpass_m is not None),
+                q_lowpass_e=q_lowpass_e,
+                q_lowpass_m=q_lowpass_m,
+                q_highpass_e=q_highpass_e,
+                q_highpass_m=q_highpass_m,
+                object_positivity=object_positivity,
+                shrinkage_rad=shrinkage_rad,
+                object_mask=self._object_fov_mask_inverse
+                if fix_potential_baseline and self._object_fov_mask_inverse.sum() > 0
+                else None,
+            )
+
+            errors[a0] = error
             if store_iterations:
-                self.object_iterations.append(asnumpy(self._object.copy()))
-                self.probe_iterations.append(asnumpy(self._probe.copy()))
+                # asnumpy already copies off the gpu, only numpy arrays need a copy
+                if xp is np:
+                    self.object_iterations.append(self._object.copy())
+                    self.probe_iterations.append(self._probe.copy())
+                else:
+                    self.object_iterations.append(asnumpy(self._object))
+                    self.probe_iterations.append(asnumpy(self._probe))
+
+        self.error_iterations.extend(asnumpy(errors).tolist())
+
+        # release the exit-wave scratch buffer between reconstructions
+        self._exit_waves_scratch = None
 
         # store result
         self.object = asnumpy(self._object)
@@ -2501,14 +2698,77 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
         min_x, max_x = x_lims
         min_y, max_y = y_lims
 
-        if angle is not None:
-            rotated_array = rotate_np(
-                asnumpy(array), angle, reshape=False, axes=(-2, -1)
+        if angle is None:
+            # crop before any device-to-host transfer
+            return asnumpy(array[..., min_x:max_x, min_y:max_y])
+
+        # only interpolate the cropped region of the rotated array
+        array = asnumpy(array)
+        array_shape = array.shape[-2:]
+        start_x, stop_x, _ = slice(min_x, max_x).indices(array_shape[0])
+        start_y, stop_y, _ = slice(min_y, max_y).indices(array_shape[1])
+        cropped_shape = (max(stop_x - start_x, 0), max(stop_y - start_y, 0))
+
+        rotation_matrix = self._plane_rotation_matrix(angle, (0, 1))[:2, :2]
+        center = (np.array(array_shape) - 1) / 2
+        offset = center - rotation_matrix @ (center - np.array([start_x, start_y]))
+
+        rotated_array = np.empty(array.shape[:-2] + cropped_shape, dtype=array.dtype)
+        for array_in, array_out in zip(
+            array.reshape((-1,) + array_shape),
+            rotated_array.reshape((-1,) + cropped_shape),
+        ):
+            affine_transform_np(
+                array_in,
+                rotation_matrix,
+                offset,
+                output=array_out,
+                order=3,
             )
-        else:
-            rotated_array = asnumpy(array)
 
-        return rotated_array[..., min_x:max_x, min_y:max_y]
+        return rotated_array
+
+    def _crop_project_volume(
+        self,
+        volume_array,
+        x_lims,
+        y_lims,
+    ):
+        """
+        Projects volume along each of its last three axes, cropping before reducing.
+        Equivalent to cropping volume.sum(1).T, volume.sum(2).T and volume.sum(0),
+        but only sums over the cropped region.
+
+        Parameters
+        ----------
+        volume_array: np.ndarray
+            Volume, or stack of volumes, to project
+        x_lims: tuple(float,float)
+            min/max x indices
+        y_lims: tuple(float,float)
+            min/max y indices
+
+        Returns
+        -------
+        projected_x: np.ndarray
+            Cropped projection along x
+        projected_y: np.ndarray
+            Cropped projection along y
+        projected_z: np.ndarray
+            Cropped projection along z
+        """
+        min_x, max_x = x_lims
+        min_y, max_y = y_lims
+
+        projected_x = volume_array[..., min_y:max_y, :, min_x:max_x].sum(-2)
+        projected_y = volume_array[..., min_y:max_y, min_x:max_x, :].sum(-1)
+        projected_z = volume_array[..., min_x:max_x, min_y:max_y].sum(-3)
+
+        return (
+            projected_x.swapaxes(-1, -2),
+            projected_y.swapaxes(-1, -2),
+            projected_z,
+        )
 
     def _visualize_last_iteration_figax(
         self,
@@ -2547,23 +2807,25 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
 
         cmap = kwargs.pop("cmap", "magma")
 
-        asnumpy = self._asnumpy
-
         if projection_angle_deg is not None:
-            rotated_3d_obj = self._rotate(
+            rotated_3d_obj = self._projection_rotate_volume(
                 self._object[0],
                 projection_angle_deg,
-                axes=projection_axes,
-                reshape=False,
-                order=2,
+                projection_axes,
             )
-            rotated_3d_obj = asnumpy(rotated_3d_obj)
         else:
-            rotated_3d_obj = self.object[0]
+            rotated_3d_obj = self._object[0]
 
-        rotated_object = self._crop_rotate_object_manually(
-            rotated_3d_obj.sum(0), angle=None, x_lims=x_lims, y_lims=y_lims
+        # crop and project on device, transferring only the 2D result
+        min_x, max_x = x_lims
+        min_y, max_y = y_lims
+        rotated_object = self._asnumpy(
+            rotated_3d_obj[:, min_x:max_x, min_y:max_y].sum(0)
         )
+
+        # the rotated volume is only needed for display, release it
+        self._projection_rotation_buffer = None
+        del rotated_3d_obj
         rotated_shape = rotated_object.shape
 
         extent = [
@@ -2587,10 +2849,9 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
             fig.colorbar(im, cax=ax_cb)
 
         if convergence_ax is not None and hasattr(self, "error_iterations"):
-            errors = np.array(self.error_iterations)
+            errors = np.asarray(self.error_iterations)
             kwargs.pop("vmin", None)
             kwargs.pop("vmax", None)
-            errors = self.error_iterations
             convergence_ax.semilogy(np.arange(errors.shape[0]), errors, **kwargs)
 
     def _visualize_last_iteration(
@@ -2631,89 +2892,44 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
         asnumpy = self._asnumpy
 
         if projection_angle_deg is not None:
-            rotated_3d_obj_V = self._rotate(
-                self._object[0],
-                projection_angle_deg,
-                axes=projection_axes,
-                reshape=False,
-                order=2,
-            )
-
-            rotated_3d_obj_Az = self._rotate(
-                self._object[1],
-                projection_angle_deg,
-                axes=projection_axes,
-                reshape=False,
-                order=2,
-            )
-
-            rotated_3d_obj_Ax = self._rotate(
-                self._object[2],
+            # rotate the stacked (V, Az, Ax, Ay) volumes in a single call
+            rotated_3d_obj = self._projection_rotate_volume(
+                self._object,
                 projection_angle_deg,
-                axes=projection_axes,
-                reshape=False,
-                order=2,
+                projection_axes,
             )
-
-            rotated_3d_obj_Ay = self._rotate(
-                self._object[3],
-                projection_angle_deg,
-                axes=projection_axes,
-                reshape=False,
-                order=2,
-            )
-
-            rotated_3d_obj_V = asnumpy(rotated_3d_obj_V)
-            rotated_3d_obj_Az = asnumpy(rotated_3d_obj_Az)
-            rotated_3d_obj_Ax = asnumpy(rotated_3d_obj_Ax)
-            rotated_3d_obj_Ay = asnumpy(rotated_3d_obj_Ay)
         else:
-            (
-                rotated_3d_obj_V,
-                rotated_3d_obj_Az,
-                rotated_3d_obj_Ax,
-                rotated_3d_obj_Ay,
-            ) = self.object
-
-        rotated_object_Vx = self._crop_rotate_object_manually(
-            rotated_3d_obj_V.sum(1).T, angle=None, x_lims=x_lims, y_lims=y_lims
-        )
-        rotated_object_Vy = self._crop_rotate_object_manually(
-            rotated_3d_obj_V.sum(2).T, angle=None, x_lims=x_lims, y_lims=y_lims
-        )
-        rotated_object_Vz = self._crop_rotate_object_manually(
-            rotated_3d_obj_V.sum(0), angle=None, x_lims=x_lims, y_lims=y_lims
-        )
+            rotated_3d_obj = self._object
 
-        rotated_object_Azx = self._crop_rotate_object_manually(
-            rotated_3d_obj_Az.sum(1).T, angle=None, x_lims=x_lims, y_lims=y_lims
-        )
-        rotated_object_Azy = self._crop_rotate_object_manually(
-            rotated_3d_obj_Az.sum(2).T, angle=None, x_lims=x_lims, y_lims=y_lims
-        )
-        rotated_object_Azz = self._crop_rotate_object_manually(
-            rotated_3d_obj_Az.sum(0), angle=None, x_lims=x_lims, y_lims=y_lims
-        )
-
-        rotated_object_Axx = self._crop_rotate_object_manually(
-            rotated_3d_obj_Ax.sum(1).T, angle=None, x_lims=x_lims, y_lims=y_lims
-        )
-        rotated_object_Axy = self._crop_rotate_object_manually(
-            rotated_3d_obj_Ax.sum(2).T, angle=None, x_lims=x_lims, y_lims=y_lims
-        )
-        rotated_object_Axz = self._crop_rotate_object_manually(
-            rotated_3d_obj_Ax.sum(0), angle=None, x_lims=x_lims, y_lims=y_lims
+        # (V, Az, Ax, Ay) projections along each axis, cropped before transferring
+        projections = tuple(
+            asnumpy(projection)
+            for projection in self._crop_project_volume(rotated_3d_obj, x_lims, y_lims)
         )
 
-        rotated_object_Ayx = self._crop_rotate_object_manually(
-            rotated_3d_obj_Ay.sum(1).T, angle=None, x_lims=x_lims, y_lims=y_lims
-        )
-        rotated_object_Ayy = self._crop_rotate_object_manually(
-            rotated_3d_obj_Ay.sum(2).T, angle=None, x_lims=x_lims, y_lims=y_lims
-        )
-        rotated_object_Ayz = self._crop_rotate_object_manually(
-            rotated_3d_obj_Ay.sum(0), angle=None, x_lims=x_lims, y_lims=y_lims
-        )
+        # the rotated volume is only needed for display, release it
+        self._projection_rotation_buffer = None
+        del rotated_3d_obj
+        (
+            (
+                rotated_object_Vx,
+                rotated_object_Azx,
+                rotated_object_Axx,
+                rotated_object_Ayx,
+            ),
+            (
+                rotated_object_Vy,
+                rotated_object_Azy,
+                rotated_object_Axy,
+                rotated_object_Ayy,
+            ),
+            (
+                rotated_object_Vz,
+                rotated_object_Azz,
+                rotated_object_Axz,
+                rotated_object_Ayz,
+            ),
+        ) = projections
 
         rotated_shape = rotated_object_Vx.shape
 
@@ -2766,28 +2982,13 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
             ],
         ]
 
-        max_e = np.array(
-            [rotated_object_Vx.max(), rotated_object_Vy.max(), rotated_object_Vz.max()]
-        ).max()
-        max_m = np.array(
-            [
-                [
-                    np.abs(rotated_object_Axx).max(),
-                    np.abs(rotated_object_Ayx).max(),
-                    np.abs(rotated_object_Azx).max(),
-                ],
-                [
-                    np.abs(rotated_object_Axy).max(),
-                    np.abs(rotated_object_Ayy).max(),
-                    np.abs(rotated_object_Azy).max(),
-                ],
-                [
-                    np.abs(rotated_object_Axz).max(),
-                    np.abs(rotated_object_Ayz).max(),
-                    np.abs(rotated_object_Azz).max(),
-                ],
-            ]
-        ).max()
+        # one reduction per projection direction over the channel stack
+        max_e = max(projection[0].max() for projection in projections)
+        # |A| max from the extrema, without materializing abs(A)
+        max_m = max(
+            max(projection[1:].max(), -projection[1:].min())
+            for projection in projections
+        )
 
         vmin_e = kwargs.pop("vmin_e", 0.0)
         vmax_e = kwargs.pop("vmax_e", max_e)
@@ -2804,19 +3005,18 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
         if fig is None:
             fig = plt.figure(figsize=figsize)
 
-        for sp in spec:
-            row, col = np.unravel_index(sp.num1, (4, 4))
+        # (cmap, vmin, vmax) for the electrostatic and the three magnetic columns
+        column_styles = [(cmap_e, vmin_e, vmax_e)] + [(cmap_m, vmin_m, vmax_m)] * 3
+        electrostatic_axes = []
+        magnetic_axes = []
 
-            if row < 3:
-                ax = fig.add_subplot(sp)
-                if sp.is_first_col():
-                    cmap = cmap_e
-                    vmin = vmin_e
-                    vmax = vmax_e
+        for row in range(3):
+            for col, (cmap, vmin, vmax) in enumerate(column_styles):
+                ax = fig.add_subplot(spec[row, col])
+                if col == 0:
+                    electrostatic_axes.append(ax)
                 else:
-                    cmap = cmap_m
-                    vmin = vmin_m
-                    vmax = vmax_m
+                    magnetic_axes.append(ax)
 
                 im = ax.imshow(
                     arrays[row][col],
@@ -2827,11 +3027,10 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
                     **kwargs,
                 )
 
-                if cbar:
-                    divider = make_axes_locatable(ax)
-                    ax_cb = divider.append_axes("right", size="5%", pad="2.5%")
-                    fig.add_axes(ax_cb)
-                    fig.colorbar(im, cax=ax_cb)
+                if col == 0:
+                    electrostatic_im = im
+                else:
+                    magnetic_im = im
 
                 ax.set_title(titles[row][col])
 
@@ -2846,7 +3045,7 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
                     ax.set_ylabel("x [A]")
 
         if plot_convergence and hasattr(self, "error_iterations"):
-            errors = np.array(self.error_iterations)
+            errors = np.asarray(self.error_iterations)
 
             ax = fig.add_subplot(spec[-1, :])
             ax.semilogy(np.arange(errors.shape[0]), errors, **kwargs)
@@ -2856,6 +3055,13 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
 
         spec.tight_layout(fig)
 
+        # panels in each group share (cmap, vmin, vmax), so one colorbar per group
+        if cbar:
+            fig.colorbar(
+                electrostatic_im, ax=electrostatic_axes, location="left", pad=0.1
+            )
+            fig.colorbar(magnetic_im, ax=magnetic_axes, pad=0.02)
+
     def _visualize_all_iterations(
         self,
         fig,
@@ -2991,22 +3197,24 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
             obj = xp.asarray(obj[0], dtype=xp.float32)
 
         if projection_angle_deg is not None:
-            rotated_3d_obj = self._rotate(
+            rotated_3d_obj = self._projection_rotate_volume(
                 obj,
                 projection_angle_deg,
-                axes=projection_axes,
-                reshape=False,
-                order=2,
+                projection_axes,
             )
-            rotated_3d_obj = asnumpy(rotated_3d_obj)
         else:
-            rotated_3d_obj = asnumpy(obj)
+            rotated_3d_obj = obj
 
-        rotated_object = self._crop_rotate_object_manually(
-            rotated_3d_obj.sum(0), angle=None, x_lims=x_lims, y_lims=y_lims
-        )
+        min_x, max_x = x_lims
+        min_y, max_y = y_lims
+        rotated_object = rotated_3d_obj[:, min_x:max_x, min_y:max_y].sum(0)
 
-        return np.abs(np.fft.fftshift(np.fft.fft2(rotated_object)))
+        # the rotated volume is only needed for display, release it
+        self._projection_rotation_buffer = None
+        del rotated_3d_obj
+
+        # only the final magnitude is transferred to the host
+        return asnumpy(xp.abs(xp.fft.fftshift(xp.fft.fft2(rotated_object))))
 
     def show_object_fft(
         self,
@@ -3077,16 +3285,14 @@ class OverlapMagneticTomographicReconstruction(PtychographicReconstruction):
         if self.angular_sampling is None:
             return None
 
+        xp = self._xp
         asnumpy = self._asnumpy
-        positions_all = []
-        for tilt_index in range(self._num_tilts):
-            positions = self._positions_px_all[
-                self._cum_probes_per_tilt[tilt_index] : self._cum_probes_per_tilt[
-                    tilt_index + 1
-                ]
-            ].copy()
-            positions[:, 0] *= self.sampling[0]
-            positions[:, 1] *= self.sampling[1]
-            positions_all.append(asnumpy(positions))
+
+        # scale and transfer all tilts at once, then split on the host
+        positions = asnumpy(
+            self._positions_px_all
+            * xp.asarray(self.sampling, dtype=self._positions_px_all.dtype)
+        )
+        positions_all = np.split(positions, self._cum_probes_per_tilt[1:-1])
 
         return np.asarray(positions_all)
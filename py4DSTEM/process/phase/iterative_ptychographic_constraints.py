@@ -155,22 +155,46 @@ class PtychographicConstraints:
             Constrained object estimate
         """
         xp = self._xp
-        qx = xp.fft.fftfreq(current_object.shape[0], self.sampling[0])
-        qy = xp.fft.fftfreq(current_object.shape[1], self.sampling[1])
 
-        qya, qxa = xp.meshgrid(qy, qx)
-        qra = xp.sqrt(qxa**2 + qya**2)
+        # the envelope only changes with the filter parameters, so reuse it
+        key = (
+            current_object.shape,
+            tuple(self.sampling),
+            q_lowpass,
+            q_highpass,
+            butterworth_order,
+        )
+        if (
+            self._butterworth_envelope_cache is not None
+            and self._butterworth_envelope_cache[0] == key
+        ):
+            env = self._butterworth_envelope_cache[1]
+        else:
+            qx = xp.fft.fftfreq(current_object.shape[0], self.sampling[0])
+            qy = xp.fft.fftfreq(current_object.shape[1], self.sampling[1])
+
+            qya, qxa = xp.meshgrid(qy, qx)
+            qra = xp.sqrt(qxa**2 + qya**2)
 
-        env = xp.ones_like(qra)
-        if q_highpass:
-            env *= 1 - 1 / (1 + (qra / q_highpass) ** (2 * butterworth_order))
-        if q_lowpass:
-            env *= 1 / (1 + (qra / q_lowpass) ** (2 * butterworth_order))
+            env = xp.ones_like(qra)
+            if q_highpass:
+                env *= 1 - 1 / (1 + (qra / q_highpass) ** (2 * butterworth_order))
+            if q_lowpass:
+                env *= 1 / (1 + (qra / q_lowpass) ** (2 * butterworth_order))
 
-        current_object = xp.fft.ifft2(xp.fft.fft2(current_object) * env)
+            self._butterworth_envelope_cache = (key, env)
+
+        if xp.isrealobj(current_object):
+            # real-valued objects only need the non-negative half of the spectrum
+            current_object = xp.fft.irfft2(
+                xp.fft.rfft2(current_object) * env[:, : env.shape[1] // 2 + 1],
+                s=current_object.shape,
+            )
+        else:
+            current_object = xp.fft.ifft2(xp.fft.fft2(current_object) * env)
 
-        if self._object_type == "potential":
-            current_object = xp.real(current_object)
+            if self._object_type == "potential":
+                current_object = xp.real(current_object)
 
         return current_object
 
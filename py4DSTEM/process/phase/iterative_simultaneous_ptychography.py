@@ -169,6 +169,7 @@ class SimultaneousPtychographicReconstruction(PtychographicReconstruction):
 
         # Class-specific Metadata
         self._simultaneous_measurements_mode = simultaneous_measurements_mode
+        self._butterworth_envelope_cache = None
 
     def preprocess(
         self,
@@ -2698,6 +2699,7 @@ class SimultaneousPtychographicReconstruction(PtychographicReconstruction):
             self.probe_iterations = []
 
         if reset:
+            self._butterworth_envelope_cache = None
             self._object = (
                 self._object_initial[0].copy(),
                 self._object_initial[1].copy(),
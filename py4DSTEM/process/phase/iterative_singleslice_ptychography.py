@@ -4,6 +4,8 @@ namely (single-slice) ptychography.
 """
 
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Mapping, Tuple
 
 import matplotlib.pyplot as plt
@@ -22,10 +24,16 @@ from py4DSTEM.classes import DataCube
 from py4DSTEM.process.phase.iterative_base_class import PtychographicReconstruction
 from py4DSTEM.process.phase.utils import (
     ComplexProbe,
+    amplitude_error,
+    complex_exponential,
     fft_shift,
     generate_batches,
+    linear_combination,
+    overlap_normalization,
+    phase_replace,
     polar_aliases,
     polar_symbols,
+    sum_squared_magnitude,
 )
 from py4DSTEM.process.utils import get_CoM, get_shifted_ar
 
@@ -115,6 +123,11 @@ class SingleslicePtychographicReconstruction(PtychographicReconstruction):
             from scipy.special import erf
 
             self._erf = erf
+            from scipy.fft import fft2, ifft2
+
+            # multi-threaded over the batch, and keeps complex64 in single precision
+            self._fft2 = partial(fft2, workers=-1)
+            self._ifft2 = partial(ifft2, workers=-1)
         elif device == "gpu":
             self._xp = cp
             self._asnumpy = cp.asnumpy
@@ -124,6 +137,13 @@ class SingleslicePtychographicReconstruction(PtychographicReconstruction):
             from cupyx.scipy.special import erf
 
             self._erf = erf
+
+            # batched cuFFT plans are cached by cupy per shape and dtype;
+            # cupyx.scipy.fft matches scipy.fft and accepts overwrite_x
+            from cupyx.scipy.fft import fft2, ifft2
+
+            self._fft2 = fft2
+            self._ifft2 = ifft2
         else:
             raise ValueError(f"device must be either 'cpu' or 'gpu', not {device}")
 
@@ -164,6 +184,8 @@ class SingleslicePtychographicReconstruction(PtychographicReconstruction):
         self._preprocessed = False
 
         # Class-specific Metadata
+        self._butterworth_envelope_cache = None
+        self._object_iterations_fov_cache = {}
 
     def preprocess(
         self,
@@ -181,6 +203,7 @@ class SingleslicePtychographicReconstruction(PtychographicReconstruction):
         force_com_transpose: float = None,
         force_com_shifts: float = None,
         object_fov_mask: np.ndarray = None,
+        max_batch_size: int = None,
         **kwargs,
     ):
         """
@@ -232,6 +255,9 @@ class SingleslicePtychographicReconstruction(PtychographicReconstruction):
         object_fov_mask: np.ndarray (boolean)
             Boolean mask of FOV. Used to calculate additional shrinkage of object
             If None, probe_overlap intensity is thresholded
+        max_batch_size: int, optional
+            Max number of probes to use at once in computing probe overlaps.
+            If None, all probes are used at once
 
         Returns
         --------
@@ -348,7 +374,8 @@ class SingleslicePtychographicReconstruction(PtychographicReconstruction):
             elif self._object_type == "complex":
                 self._object = xp.asarray(self._object, dtype=xp.complex64)
 
-        self._object_initial = self._object.copy()
+        # host-side backup, only needed again on reset
+        self._object_initial = np.array(asnumpy(self._object))
         self._object_type_initial = self._object_type
         self._object_shape = self._object.shape
 
@@ -407,7 +434,8 @@ class SingleslicePtychographicReconstruction(PtychographicReconstruction):
             )
 
             # Normalize probe to match mean diffraction intensity
-            probe_intensity = xp.sum(xp.abs(xp.fft.fft2(self._probe)) ** 2)
+            # sum(|fft2(probe)|^2) = size * sum(|probe|^2) by Parseval's theorem
+            probe_intensity = self._probe.size * xp.sum(xp.abs(self._probe) ** 2)
             self._probe *= xp.sqrt(self._mean_diffraction_intensity / probe_intensity)
 
         else:
@@ -421,13 +449,16 @@ class SingleslicePtychographicReconstruction(PtychographicReconstruction):
                     self._probe = self._probe.build()._array
 
                 # Normalize probe to match mean diffraction intensity
-                probe_intensity = xp.sum(xp.abs(xp.fft.fft2(self._probe)) ** 2)
+                # sum(|fft2(probe)|^2) = size * sum(|probe|^2) by Parseval's theorem
+                probe_intensity = self._probe.size * xp.sum(xp.abs(self._probe) ** 2)
                 self._probe *= xp.sqrt(
                     self._mean_diffraction_intensity / probe_intensity
                 )
             else:
                 self._probe = xp.asarray(self._probe, dtype=xp.complex64)
 
+        # keep the probe in single precision, however it was provided
+        self._probe = self._probe.astype(xp.complex64, copy=False)
         self._probe_initial = self._probe.copy()
 
         self._known_aberrations_array = ComplexProbe(
@@ -441,9 +472,25 @@ class SingleslicePtychographicReconstruction(PtychographicReconstruction):
         self._known_aberrations_array = xp.fft.ifftshift(self._known_aberrations_array)
 
         # overlaps
-        shifted_probes = fft_shift(self._probe, self._positions_px_fractional, xp)
-        probe_intensities = xp.abs(shifted_probes) ** 2
-        probe_overlap = self._sum_overlapping_patches_bincounts(probe_intensities)
+        if max_batch_size is None:
+            max_batch_size = self._num_diffraction_patterns
+
+        positions_px = self._positions_px
+        positions_px_fractional = self._positions_px_fractional
+        probe_overlap = xp.zeros(self._object_shape, dtype=xp.float32)
+
+        for start, end in generate_batches(
+            self._num_diffraction_patterns, max_batch=max_batch_size
+        ):
+            self._positions_px = positions_px[start:end]
+            shifted_probes = fft_shift(
+                self._probe, positions_px_fractional[start:end], xp
+            )
+            probe_intensities = xp.abs(shifted_probes) ** 2
+            probe_overlap += self._sum_overlapping_patches_bincounts(probe_intensities)
+
+        self._positions_px = positions_px
+
         probe_overlap = self._gaussian_filter(probe_overlap, 1.0)
 
         if object_fov_mask is None:
@@ -550,13 +597,27 @@ class SingleslicePtychographicReconstruction(PtychographicReconstruction):
         shifted_probes = fft_shift(current_probe, self._positions_px_fractional, xp)
 
         if self._object_type == "potential":
-            complex_object = xp.exp(1j * current_object)
+            # exponentiate whichever is smaller, the object or the batch of patches
+            num_patch_pixels = self._positions_px.shape[0] * np.prod(
+                self._region_of_interest_shape
+            )
+            if num_patch_pixels < current_object.size:
+                object_patches = complex_exponential(
+                    current_object[
+                        self._vectorized_patch_indices_row,
+                        self._vectorized_patch_indices_col,
+                    ],
+                    xp,
+                )
+            else:
+                object_patches = complex_exponential(current_object, xp)[
+                    self._vectorized_patch_indices_row,
+                    self._vectorized_patch_indices_col,
+                ]
         else:
-            complex_object = current_object
-
-        object_patches = complex_object[
-            self._vectorized_patch_indices_row, self._vectorized_patch_indices_col
-        ]
+            object_patches = current_object[
+                self._vectorized_patch_indices_row, self._vectorized_patch_indices_col
+            ]
 
         overlap = shifted_probes * object_patches
 
@@ -582,13 +643,13 @@ class SingleslicePtychographicReconstruction(PtychographicReconstruction):
         """
 
         xp = self._xp
-        fourier_overlap = xp.fft.fft2(overlap)
-        error = xp.sum(xp.abs(amplitudes - xp.abs(fourier_overlap)) ** 2)
+        fourier_overlap = self._fft2(overlap)
+        error = amplitude_error(fourier_overlap, amplitudes, xp)
 
-        fourier_modified_overlap = amplitudes * xp.exp(1j * xp.angle(fourier_overlap))
-        modified_overlap = xp.fft.ifft2(fourier_modified_overlap)
-
-        exit_waves = modified_overlap - overlap
+        # amplitude replacement and inverse transform reuse the same buffer
+        phase_replace(fourier_overlap, amplitudes, xp, out=fourier_overlap)
+        exit_waves = self._ifft2(fourier_overlap, overwrite_x=True)
+        exit_waves -= overlap
 
         return exit_waves, error
 
@@ -637,21 +698,25 @@ class SingleslicePtychographicReconstruction(PtychographicReconstruction):
         if exit_waves is None:
             exit_waves = overlap.copy()
 
-        fourier_overlap = xp.fft.fft2(overlap)
-        error = xp.sum(xp.abs(amplitudes - xp.abs(fourier_overlap)) ** 2)
-
-        factor_to_be_projected = projection_c * overlap + projection_y * exit_waves
-        fourier_projected_factor = xp.fft.fft2(factor_to_be_projected)
+        fourier_overlap = self._fft2(overlap)
+        error = amplitude_error(fourier_overlap, amplitudes, xp)
 
-        fourier_projected_factor = amplitudes * xp.exp(
-            1j * xp.angle(fourier_projected_factor)
+        factor_to_be_projected = linear_combination(
+            (projection_c, projection_y), (overlap, exit_waves), xp
         )
-        projected_factor = xp.fft.ifft2(fourier_projected_factor)
+        fourier_projected_factor = self._fft2(factor_to_be_projected, overwrite_x=True)
 
-        exit_waves = (
-            projection_x * exit_waves
-            + projection_a * overlap
-            + projection_b * projected_factor
+        phase_replace(
+            fourier_projected_factor, amplitudes, xp, out=fourier_projected_factor
+        )
+        projected_factor = self._ifft2(fourier_projected_factor, overwrite_x=True)
+
+        # update exit waves in place, they are owned by the reconstruction
+        exit_waves = linear_combination(
+            (projection_x, projection_a, projection_b),
+            (exit_waves, overlap, projected_factor),
+            xp,
+            out=exit_waves,
         )
 
         return exit_waves, error
@@ -767,48 +832,36 @@ class SingleslicePtychographicReconstruction(PtychographicReconstruction):
         probe_normalization = self._sum_overlapping_patches_bincounts(
             xp.abs(shifted_probes) ** 2
         )
-        probe_normalization = 1 / xp.sqrt(
-            1e-16
-            + ((1 - normalization_min) * probe_normalization) ** 2
-            + (normalization_min * xp.max(probe_normalization)) ** 2
+        probe_normalization = overlap_normalization(
+            probe_normalization, normalization_min, xp
         )
 
         if self._object_type == "potential":
+            # real(-1j * z) = imag(z), evaluated without a complex temporary
             current_object += step_size * (
-                self._sum_overlapping_patches_bincounts(
-                    xp.real(
-                        -1j
-                        * xp.conj(object_patches)
-                        * xp.conj(shifted_probes)
-                        * exit_waves
-                    )
+                self._sum_overlapping_conjugate_product_imag(
+                    object_patches, shifted_probes, exit_waves
                 )
                 * probe_normalization
             )
         elif self._object_type == "complex":
+            # conj(P) * E, built in place to keep a single (N,Sx,Sy) temporary
+            object_update = xp.conj(shifted_probes)
+            object_update *= exit_waves
             current_object += step_size * (
-                self._sum_overlapping_patches_bincounts(
-                    xp.conj(shifted_probes) * exit_waves
-                )
+                self._sum_overlapping_patches_bincounts(object_update)
                 * probe_normalization
             )
 
         if not fix_probe:
-            object_normalization = xp.sum(
-                (xp.abs(object_patches) ** 2),
-                axis=0,
-            )
-            object_normalization = 1 / xp.sqrt(
-                1e-16
-                + ((1 - normalization_min) * object_normalization) ** 2
-                + (normalization_min * xp.max(object_normalization)) ** 2
+            object_normalization = sum_squared_magnitude(object_patches, xp)
+            object_normalization = overlap_normalization(
+                object_normalization, normalization_min, xp
             )
 
+            # contracting over positions avoids an (N,Sx,Sy) product temporary
             current_probe += step_size * (
-                xp.sum(
-                    xp.conj(object_patches) * exit_waves,
-                    axis=0,
-                )
+                xp.einsum("nij,nij->ij", xp.conj(object_patches), exit_waves)
                 * object_normalization
             )
 
@@ -857,48 +910,36 @@ class SingleslicePtychographicReconstruction(PtychographicReconstruction):
         probe_normalization = self._sum_overlapping_patches_bincounts(
             xp.abs(shifted_probes) ** 2
         )
-        probe_normalization = 1 / xp.sqrt(
-            1e-16
-            + ((1 - normalization_min) * probe_normalization) ** 2
-            + (normalization_min * xp.max(probe_normalization)) ** 2
+        probe_normalization = overlap_normalization(
+            probe_normalization, normalization_min, xp
         )
 
         if self._object_type == "potential":
+            # real(-1j * z) = imag(z), evaluated without a complex temporary
             current_object = (
-                self._sum_overlapping_patches_bincounts(
-                    xp.real(
-                        -1j
-                        * xp.conj(object_patches)
-                        * xp.conj(shifted_probes)
-                        * exit_waves
-                    )
+                self._sum_overlapping_conjugate_product_imag(
+                    object_patches, shifted_probes, exit_waves
                 )
                 * probe_normalization
             )
         elif self._object_type == "complex":
+            # conj(P) * E, built in place to keep a single (N,Sx,Sy) temporary
+            object_update = xp.conj(shifted_probes)
+            object_update *= exit_waves
             current_object = (
-                self._sum_overlapping_patches_bincounts(
-                    xp.conj(shifted_probes) * exit_waves
-                )
+                self._sum_overlapping_patches_bincounts(object_update)
                 * probe_normalization
             )
 
         if not fix_probe:
-            object_normalization = xp.sum(
-                (xp.abs(object_patches) ** 2),
-                axis=0,
-            )
-            object_normalization = 1 / xp.sqrt(
-                1e-16
-                + ((1 - normalization_min) * object_normalization) ** 2
-                + (normalization_min * xp.max(object_normalization)) ** 2
+            object_normalization = sum_squared_magnitude(object_patches, xp)
+            object_normalization = overlap_normalization(
+                object_normalization, normalization_min, xp
             )
 
+            # contracting over positions avoids an (N,Sx,Sy) product temporary
             current_probe = (
-                xp.sum(
-                    xp.conj(object_patches) * exit_waves,
-                    axis=0,
-                )
+                xp.einsum("nij,nij->ij", xp.conj(object_patches), exit_waves)
                 * object_normalization
             )
 
@@ -1410,21 +1451,39 @@ class SingleslicePtychographicReconstruction(PtychographicReconstruction):
 
         # Batching
         shuffled_indices = np.arange(self._num_diffraction_patterns)
-        unshuffled_indices = np.zeros_like(shuffled_indices)
 
         if max_batch_size is not None:
             xp.random.seed(seed_random)
         else:
             max_batch_size = self._num_diffraction_patterns
 
+        # a single batch covers every position, so its order is irrelevant
+        shuffle_batches = (
+            not use_projection_scheme
+            and max_batch_size < self._num_diffraction_patterns
+        )
+
+        # batch amplitudes are gathered into one reusable buffer, and the inverse
+        # permutation is only needed when the positions are actually shuffled
+        if shuffle_batches:
+            unshuffled_indices = np.zeros_like(shuffled_indices)
+            amplitudes_buffer = xp.empty(
+                (max_batch_size,) + self._amplitudes.shape[1:],
+                dtype=self._amplitudes.dtype,
+            )
+
         # initialization
         if store_iterations and (not hasattr(self, "object_iterations") or reset):
             self.object_iterations = []
             self.probe_iterations = []
 
+        # cropped iterations depend on the positions, which may be updated
+        self._object_iterations_fov_cache = {}
+
         if reset:
             self.error_iterations = []
-            self._object = self._object_initial.copy()
+            self._butterworth_envelope_cache = None
+            self._object = xp.array(self._object_initial)
             self._probe = self._probe_initial.copy()
             self._positions_px = self._positions_px_initial.copy()
             self._positions_px_fractional = self._positions_px - xp.round(
@@ -1450,12 +1509,17 @@ class SingleslicePtychographicReconstruction(PtychographicReconstruction):
                 self._exit_waves = None
 
         # main loop
-        for a0 in tqdmnd(
-            max_iter,
-            desc="Reconstructing object and probe",
-            unit=" iter",
-            disable=not progress_bar,
-        ):
+        # a plain range avoids the disabled progress bar's per-iteration wrapper
+        if progress_bar:
+            iterations = tqdmnd(
+                max_iter,
+                desc="Reconstructing object and probe",
+                unit=" iter",
+            )
+        else:
+            iterations = range(max_iter)
+
+        for a0 in iterations:
             error = 0.0
 
             if a0 == switch_object_iter:
@@ -1467,26 +1531,49 @@ class SingleslicePtychographicReconstruction(PtychographicReconstruction):
                     self._object = xp.angle(self._object)
 
             # randomize
-            if not use_projection_scheme:
+            if shuffle_batches:
                 np.random.shuffle(shuffled_indices)
-            unshuffled_indices[shuffled_indices] = np.arange(
-                self._num_diffraction_patterns
-            )
-            positions_px = self._positions_px.copy()[shuffled_indices]
+                unshuffled_indices[shuffled_indices] = np.arange(
+                    self._num_diffraction_patterns
+                )
+
+                # upload the batch order once per iteration, gathers copy already
+                shuffled_indices_device = xp.asarray(shuffled_indices)
+                positions_px = self._positions_px[shuffled_indices_device]
+            else:
+                positions_px = self._positions_px.copy()
+
+            # batches are disjoint, so position corrections never touch later slices
+            positions_px_rounded = xp.round(positions_px)
+            positions_px_fractional = positions_px - positions_px_rounded
 
             for start, end in generate_batches(
                 self._num_diffraction_patterns, max_batch=max_batch_size
             ):
                 # batch indices
                 self._positions_px = positions_px[start:end]
-                self._positions_px_fractional = self._positions_px - xp.round(
-                    self._positions_px
-                )
-                (
-                    self._vectorized_patch_indices_row,
-                    self._vectorized_patch_indices_col,
-                ) = self._extract_vectorized_patch_indices()
-                amplitudes = self._amplitudes[shuffled_indices[start:end]]
+
+                # an unshuffled single batch keeps the previous iteration's
+                # patch indices while positions are fixed
+                if shuffle_batches or not 0 < a0 <= fix_positions_iter:
+                    self._positions_px_fractional = positions_px_fractional[start:end]
+                    (
+                        self._vectorized_patch_indices_row,
+                        self._vectorized_patch_indices_col,
+                    ) = self._extract_vectorized_patch_indices(
+                        positions_px_rounded[start:end]
+                    )
+
+                if shuffle_batches:
+                    amplitudes = xp.take(
+                        self._amplitudes,
+                        shuffled_indices_device[start:end],
+                        axis=0,
+                        out=amplitudes_buffer[: end - start],
+                    )
+                else:
+                    # unshuffled, so a view avoids gathering a copy
+                    amplitudes = self._amplitudes[start:end]
 
                 # forward operator
                 (
@@ -1537,7 +1624,10 @@ class SingleslicePtychographicReconstruction(PtychographicReconstruction):
             error /= self._mean_diffraction_intensity * self._num_diffraction_patterns
 
             # constraints
-            self._positions_px = positions_px.copy()[unshuffled_indices]
+            if shuffle_batches:
+                self._positions_px = positions_px[xp.asarray(unshuffled_indices)]
+            else:
+                self._positions_px = positions_px
             self._object, self._probe, self._positions_px = self._constraints(
                 self._object,
                 self._probe,
@@ -1587,6 +1677,34 @@ class SingleslicePtychographicReconstruction(PtychographicReconstruction):
 
         return self
 
+    def _object_iteration_fov(self, index: int, padding: int):
+        """
+        Returns the cropped and rotated phase (or potential) of a stored object
+        iteration, reusing previous results until the next reconstruction.
+
+        Parameters
+        --------
+        index: int
+            Index into self.object_iterations
+        padding : int
+            Pixels to pad by post rotating-cropping object
+
+        Returns
+        --------
+        rotated_object: np.ndarray
+            Cropped and rotated object iteration
+        """
+        cache = self._object_iterations_fov_cache
+
+        key = (index, padding)
+        if key not in cache:
+            obj = self.object_iterations[index]
+            if np.iscomplexobj(obj):
+                obj = np.angle(obj)
+            cache[key] = self._crop_rotate_object_fov(obj, padding=padding)
+
+        return cache[key]
+
     def _visualize_last_iteration_figax(
         self,
         fig,
@@ -1613,6 +1731,7 @@ class SingleslicePtychographicReconstruction(PtychographicReconstruction):
             Pixels to pad by post rotating-cropping object
         """
         cmap = kwargs.pop("cmap", "magma")
+        interpolation = kwargs.pop("interpolation", "nearest")
 
         if self._object_type == "complex":
             obj = np.angle(self.object)
@@ -1632,6 +1751,7 @@ class SingleslicePtychographicReconstruction(PtychographicReconstruction):
         im = object_ax.imshow(
             rotated_object,
             extent=extent,
+            interpolation=interpolation,
             cmap=cmap,
             **kwargs,
         )
@@ -1645,8 +1765,7 @@ class SingleslicePtychographicReconstruction(PtychographicReconstruction):
         if convergence_ax is not None and hasattr(self, "error_iterations"):
             kwargs.pop("vmin", None)
             kwargs.pop("vmax", None)
-            errors = self.error_iterations
-            convergence_ax.semilogy(np.arange(len(errors)), errors, **kwargs)
+            convergence_ax.semilogy(*self._decimated_error_iterations(), **kwargs)
 
     def _visualize_last_iteration(
         self,
@@ -1678,6 +1797,7 @@ class SingleslicePtychographicReconstruction(PtychographicReconstruction):
         """
         figsize = kwargs.pop("figsize", (8, 5))
         cmap = kwargs.pop("cmap", "magma")
+        interpolation = kwargs.pop("interpolation", "nearest")
         invert = kwargs.pop("invert", False)
         hue_start = kwargs.pop("hue_start", 0)
 
@@ -1741,6 +1861,7 @@ class SingleslicePtychographicReconstruction(PtychographicReconstruction):
             im = ax.imshow(
                 rotated_object,
                 extent=extent,
+                interpolation=interpolation,
                 cmap=cmap,
                 **kwargs,
             )
@@ -1776,6 +1897,7 @@ class SingleslicePtychographicReconstruction(PtychographicReconstruction):
             im = ax.imshow(
                 probe_array,
                 extent=probe_extent,
+                interpolation=interpolation,
                 **kwargs,
             )
             ax.set_ylabel("x [A]")
@@ -1791,6 +1913,7 @@ class SingleslicePtychographicReconstruction(PtychographicReconstruction):
             im = ax.imshow(
                 rotated_object,
                 extent=extent,
+                interpolation=interpolation,
                 cmap=cmap,
                 **kwargs,
             )
@@ -1810,12 +1933,11 @@ class SingleslicePtychographicReconstruction(PtychographicReconstruction):
         if plot_convergence and hasattr(self, "error_iterations"):
             kwargs.pop("vmin", None)
             kwargs.pop("vmax", None)
-            errors = np.array(self.error_iterations)
             if plot_probe:
                 ax = fig.add_subplot(spec[1, :])
             else:
                 ax = fig.add_subplot(spec[1])
-            ax.semilogy(np.arange(errors.shape[0]), errors, **kwargs)
+            ax.semilogy(*self._decimated_error_iterations(), **kwargs)
             ax.set_ylabel("NMSE")
             ax.set_xlabel("Iteration Number")
             ax.yaxis.tick_right()
@@ -1892,30 +2014,43 @@ class SingleslicePtychographicReconstruction(PtychographicReconstruction):
         )
         figsize = kwargs.pop("figsize", auto_figsize)
         cmap = kwargs.pop("cmap", "inferno")
+        interpolation = kwargs.pop("interpolation", "nearest")
         invert = kwargs.pop("invert", False)
         hue_start = kwargs.pop("hue_start", 0)
 
-        errors = np.array(self.error_iterations)
-
-        objects = []
-        object_type = []
-
-        for obj in self.object_iterations:
-            if np.iscomplexobj(obj):
-                obj = np.angle(obj)
-                object_type.append("phase")
-            else:
-                object_type.append("potential")
-            objects.append(self._crop_rotate_object_fov(obj, padding=padding))
-
         if plot_probe or plot_fourier_probe:
             total_grids = (np.prod(iterations_grid) / 2).astype("int")
             probes = self.probe_iterations
         else:
             total_grids = np.prod(iterations_grid)
-        max_iter = len(objects) - 1
+        max_iter = len(self.object_iterations) - 1
         grid_range = range(0, max_iter + 1, max_iter // (total_grids - 1))
 
+        # only the iterations shown in the grid are cropped and rotated, in
+        # parallel threads since np.angle and scipy's rotate release the GIL
+        shown_iterations = grid_range[:total_grids]
+        object_type = {
+            a0: "phase" if np.iscomplexobj(self.object_iterations[a0]) else "potential"
+            for a0 in shown_iterations
+        }
+
+        with ThreadPoolExecutor() as executor:
+            objects = dict(
+                zip(
+                    shown_iterations,
+                    executor.map(
+                        partial(self._object_iteration_fov, padding=padding),
+                        shown_iterations,
+                    ),
+                )
+            )
+
+        # share one color scale across the object tiles, so iterations are
+        # directly comparable and matplotlib need not autoscale each tile
+        if not any(key in kwargs for key in ("vmin", "vmax", "norm")):
+            kwargs["vmin"] = min(obj.min() for obj in objects.values())
+            kwargs["vmax"] = max(obj.max() for obj in objects.values())
+
         extent = [
             0,
             self.sampling[1] * objects[0].shape[1],
@@ -1959,6 +2094,7 @@ class SingleslicePtychographicReconstruction(PtychographicReconstruction):
             im = ax.imshow(
                 objects[grid_range[n]],
                 extent=extent,
+                interpolation=interpolation,
                 cmap=cmap,
                 **kwargs,
             )
@@ -1998,6 +2134,7 @@ class SingleslicePtychographicReconstruction(PtychographicReconstruction):
                 im = ax.imshow(
                     probe_array,
                     extent=probe_extent,
+                    interpolation=interpolation,
                     **kwargs,
                 )
 
@@ -2016,7 +2153,7 @@ class SingleslicePtychographicReconstruction(PtychographicReconstruction):
                 ax2 = fig.add_subplot(spec[2])
             else:
                 ax2 = fig.add_subplot(spec[1])
-            ax2.semilogy(np.arange(errors.shape[0]), errors, **kwargs)
+            ax2.semilogy(*self._decimated_error_iterations(), **kwargs)
             ax2.set_ylabel("NMSE")
             ax2.set_xlabel("Iteration Number")
             ax2.yaxis.tick_right()
@@ -1,3 +1,4 @@
+import math
 from typing import Mapping, Tuple, Union
 
 import matplotlib.pyplot as plt
@@ -10,6 +11,11 @@ except ImportError:
     cp = None
     from scipy.fft import dstn, idstn
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
 from py4DSTEM.process.utils.cross_correlate import align_and_shift_images
 from py4DSTEM.process.utils.utils import electron_wavelength_angstrom
 from scipy.ndimage import gaussian_filter
@@ -556,12 +562,633 @@ def fft_shift(array, positions, xp=np):
 
     if len(translation_operator.shape) == 3 and len(fourier_array.shape) == 3:
         shifted_fourier_array = fourier_array[None] * translation_operator[:, None]
+    elif len(fourier_array.shape) == 2:
+        # operator is freshly allocated at the output shape, so apply in place
+        translation_operator *= fourier_array
+        shifted_fourier_array = translation_operator
     else:
         shifted_fourier_array = fourier_array * translation_operator
 
     return xp.fft.ifft2(shifted_fourier_array)
 
 
+### Fourier-projection functions
+
+if cp is not None:
+    _phase_replace_kernel = cp.ElementwiseKernel(
+        "T z, R amplitude",
+        "T out",
+        """
+        const double magnitude = abs(z);
+        if (magnitude > 0) {
+            const double scale = amplitude / magnitude;
+            out = T(real(z) * scale, imag(z) * scale);
+        } else {
+            out = T(amplitude, 0);
+        }
+        """,
+        "phase_replace",
+    )
+
+    _amplitude_error_kernel = cp.ReductionKernel(
+        "T z, R amplitude",
+        "R error",
+        "(amplitude - abs(z)) * (amplitude - abs(z))",
+        "a + b",
+        "error = a",
+        "0",
+        "amplitude_error",
+    )
+
+    _overlap_normalization_kernel = cp.ElementwiseKernel(
+        "T intensity, T max_intensity, float64 normalization_min",
+        "T out",
+        """
+        const T regularized = (1 - normalization_min) * intensity;
+        const T floor = normalization_min * max_intensity;
+        out = rsqrt((T)1e-16 + regularized * regularized + floor * floor);
+        """,
+        "overlap_normalization",
+    )
+
+    _conjugate_product_imag_kernel = cp.ElementwiseKernel(
+        "T a, T b, T c",
+        "R out",
+        "out = imag(conj(a) * conj(b) * c)",
+        "conjugate_product_imag",
+    )
+
+
+if numba is not None:
+
+    @numba.njit(parallel=True, fastmath=True)
+    def _complex_exponential_numba(phase, out):
+        for i in numba.prange(phase.size):
+            out[i] = complex(math.cos(phase[i]), math.sin(phase[i]))
+
+    @numba.njit(parallel=True, fastmath=True)
+    def _amplitude_error_numba(array, amplitudes):
+        error = 0.0
+        for i in numba.prange(array.size):
+            difference = amplitudes[i] - abs(array[i])
+            error += difference * difference
+        return error
+
+    @numba.njit(parallel=True, fastmath=True)
+    def _sum_squared_magnitude_numba(array, out, block_size=4096):
+        num_arrays, size = array.shape
+        for b in numba.prange((size + block_size - 1) // block_size):
+            start = b * block_size
+            end = min(start + block_size, size)
+            for i in range(start, end):
+                out[i] = 0
+            # stream each array contiguously within the pixel block
+            for n in range(num_arrays):
+                for i in range(start, end):
+                    out[i] += array[n, i].real ** 2 + array[n, i].imag ** 2
+
+    @numba.njit(parallel=True, fastmath=True)
+    def _conjugate_product_imag_numba(a, b, c, out):
+        for i in numba.prange(out.size):
+            out[i] = (a[i].conjugate() * b[i].conjugate() * c[i]).imag
+
+    @numba.njit(parallel=True, fastmath=True)
+    def _linear_combination_2_numba(a, x, b, y, out):
+        for i in numba.prange(out.size):
+            out[i] = a * x[i] + b * y[i]
+
+    @numba.njit(parallel=True, fastmath=True)
+    def _linear_combination_3_numba(a, x, b, y, c, z, out):
+        for i in numba.prange(out.size):
+            out[i] = a * x[i] + b * y[i] + c * z[i]
+
+
+def complex_exponential(phase, xp=np):
+    """
+    Computes exp(1j * phase) for a real-valued phase array.
+    On the CPU, uses a vectorized numba sin/cos kernel if numba is available.
+
+    Parameters
+    ----------
+    phase: np.ndarray
+        Real-valued phase array
+    xp: Callable
+        Array computing module
+
+    Returns
+    -------
+        Complex exponential of phase
+    """
+    if xp is not np or numba is None:
+        return xp.exp(1j * phase)
+
+    phase = np.ascontiguousarray(phase)
+    out = np.empty(phase.shape, dtype=np.result_type(phase.dtype, np.complex64))
+    _complex_exponential_numba(phase.reshape(-1), out.reshape(-1))
+
+    return out
+
+
+def phase_replace(array, amplitudes, xp=np, out=None):
+    """
+    Replaces the modulus of a complex array with amplitudes, keeping its phase.
+    Equivalent to amplitudes * exp(1j * angle(array)), but evaluated as
+    amplitudes * array / abs(array) to avoid the arctan/sincos pair, fused into
+    a single elementwise kernel on the GPU.
+
+    Parameters
+    ----------
+    array: np.ndarray
+        Complex array whose phase is kept
+    amplitudes: np.ndarray
+        Real amplitudes to impose, broadcastable to array
+    xp: Callable
+        Array computing module
+    out: np.ndarray, optional
+        Complex output array, may be array itself. If None, a new array is allocated
+
+    Returns
+    -------
+        Amplitude-replaced complex array
+    """
+    if xp is np:
+        magnitude = xp.abs(array)
+        zero_magnitude = magnitude == 0
+        magnitude[zero_magnitude] = 1
+        scale = amplitudes / magnitude
+
+        if out is None:
+            out = array * scale
+        else:
+            xp.multiply(array, scale, out=out)
+
+        # angle(0) = 0, so zero entries take the amplitude as a real value
+        if zero_magnitude.any():
+            out[zero_magnitude] = xp.broadcast_to(amplitudes, out.shape)[zero_magnitude]
+        return out
+
+    if out is None:
+        return _phase_replace_kernel(array, amplitudes)
+    return _phase_replace_kernel(array, amplitudes, out)
+
+
+def amplitude_error(array, amplitudes, xp=np):
+    """
+    Computes the squared error between the modulus of a complex array and the
+    measured amplitudes, sum(|amplitudes - abs(array)|^2).
+    Evaluated as a single fused reduction, using numba on the CPU if available.
+
+    Parameters
+    ----------
+    array: np.ndarray
+        Complex array, e.g. Fourier-space exit waves
+    amplitudes: np.ndarray
+        Real amplitudes to compare against, same shape as array
+    xp: Callable
+        Array computing module
+
+    Returns
+    -------
+        Scalar squared error
+    """
+    if xp is not np:
+        return _amplitude_error_kernel(array, amplitudes)
+
+    if (
+        numba is None
+        or array.shape != amplitudes.shape
+        or not array.flags.c_contiguous
+        or not amplitudes.flags.c_contiguous
+    ):
+        return xp.sum(xp.abs(amplitudes - xp.abs(array)) ** 2)
+
+    return _amplitude_error_numba(array.reshape(-1), amplitudes.reshape(-1))
+
+
+def sum_squared_magnitude(array, xp=np):
+    """
+    Computes sum(abs(array)**2, axis=0) for a stack of complex arrays.
+    On the CPU, accumulates real**2 + imag**2 in a single numba pass if numba is
+    available, avoiding the sqrt-then-square roundtrip and the temporary array.
+
+    Parameters
+    ----------
+    array: (N,Sx,Sy) np.ndarray
+        Complex array stack
+    xp: Callable
+        Array computing module
+
+    Returns
+    -------
+    out_array: (Sx,Sy) np.ndarray
+        Summed squared magnitudes
+    """
+    if xp is not np or numba is None:
+        return xp.sum(xp.abs(array) ** 2, axis=0)
+
+    array = np.ascontiguousarray(array)
+    out = np.empty(array.shape[1:], dtype=array.real.dtype)
+    _sum_squared_magnitude_numba(array.reshape(array.shape[0], -1), out.reshape(-1))
+
+    return out
+
+
+def linear_combination(coefficients, arrays, xp=np, out=None):
+    """
+    Computes sum(coefficient * array) over two or three same-shaped arrays.
+    On the CPU, streams all arrays in a single numba pass if numba is available.
+
+    Parameters
+    ----------
+    coefficients: Sequence[float]
+        Scalar weights, one per array
+    arrays: Sequence[np.ndarray]
+        Arrays to combine, all of the same shape and dtype
+    xp: Callable
+        Array computing module
+    out: np.ndarray, optional
+        Output array, may be the first input. If None, a new array is allocated
+
+    Returns
+    -------
+        Linear combination of arrays
+    """
+    contiguous = all(array.flags.c_contiguous for array in arrays)
+    if xp is not np or numba is None or not contiguous or len(arrays) not in (2, 3):
+        if out is None:
+            out = coefficients[0] * arrays[0]
+        else:
+            xp.multiply(arrays[0], coefficients[0], out=out)
+        for c, array in zip(coefficients[1:], arrays[1:]):
+            out += c * array
+        return out
+
+    if out is None:
+        out = np.empty_like(arrays[0])
+
+    flat_arguments = []
+    for c, array in zip(coefficients, arrays):
+        flat_arguments.extend((c, array.reshape(-1)))
+
+    if len(arrays) == 2:
+        _linear_combination_2_numba(*flat_arguments, out.reshape(-1))
+    else:
+        _linear_combination_3_numba(*flat_arguments, out.reshape(-1))
+
+    return out
+
+
+def conjugate_product_imag(a, b, c, xp=np):
+    """
+    Computes imag(conj(a) * conj(b) * c) for same-shaped complex arrays.
+    Evaluated in a single elementwise pass writing only the real-valued result,
+    using numba on the CPU if available.
+
+    Parameters
+    ----------
+    a, b: np.ndarray
+        Complex arrays entering conjugated
+    c: np.ndarray
+        Complex array
+    xp: Callable
+        Array computing module
+
+    Returns
+    -------
+        Real-valued imaginary part of the product
+    """
+    out = xp.empty(a.shape, dtype=a.real.dtype)
+
+    if xp is not np:
+        return _conjugate_product_imag_kernel(a, b, c, out)
+
+    if numba is None:
+        # conj(a) * conj(b) = conj(a * b) saves one conjugation pass
+        product = a * b
+        xp.conj(product, out=product)
+        product *= c
+        return xp.imag(product)
+
+    _conjugate_product_imag_numba(
+        np.ascontiguousarray(a).reshape(-1),
+        np.ascontiguousarray(b).reshape(-1),
+        np.ascontiguousarray(c).reshape(-1),
+        out.reshape(-1),
+    )
+    return out
+
+
+def overlap_normalization(intensity, normalization_min, xp=np):
+    """
+    Computes the regularized inverse overlap intensity used to normalize
+    object and probe updates,
+    1 / sqrt(1e-16 + ((1-m) * intensity)^2 + (m * max(intensity))^2).
+    Evaluated as a single rsqrt kernel on the GPU.
+
+    Parameters
+    ----------
+    intensity: np.ndarray
+        Real-valued overlap intensity
+    normalization_min: float
+        Normalization minimum m, as a fraction of the maximum overlap intensity
+    xp: Callable
+        Array computing module
+
+    Returns
+    -------
+        Inverse overlap normalization
+    """
+    max_intensity = xp.max(intensity)
+
+    if xp is not np:
+        return _overlap_normalization_kernel(
+            intensity, max_intensity, float(normalization_min)
+        )
+
+    normalization = (1 - normalization_min) * intensity
+    xp.square(normalization, out=normalization)
+    normalization += 1e-16 + (normalization_min * max_intensity) ** 2
+    xp.sqrt(normalization, out=normalization)
+    return xp.reciprocal(normalization, out=normalization)
+
+
+### Patch functions
+
+if cp is not None:
+    _scatter_add_patches_kernel = cp.ElementwiseKernel(
+        "T patch, raw int32 x0, raw int32 y0, raw int32 x_ind, raw int32 y_ind, "
+        "int32 sx, int32 sy, int32 px, int32 py",
+        "raw T out",
+        """
+        const int n = i / (sx * sy);
+        const int r = (i / sy) % sx;
+        const int c = i % sy;
+        int row = (x0[n] + x_ind[r]) % px;
+        int col = (y0[n] + y_ind[c]) % py;
+        if (row < 0) row += px;
+        if (col < 0) col += py;
+        atomicAdd(&out[row * py + col], patch);
+        """,
+        "scatter_add_patches",
+    )
+
+if numba is not None:
+
+    @numba.njit(parallel=True)
+    def _scatter_add_patches_numba(patches, x0, y0, x_ind, y_ind, out_stack):
+        num_chunks, px, py = out_stack.shape
+        num_patches, sx, sy = patches.shape
+        for t in numba.prange(num_chunks):
+            for n in range(t, num_patches, num_chunks):
+                for r in range(sx):
+                    row = (x0[n] + x_ind[r]) % px
+                    for c in range(sy):
+                        col = (y0[n] + y_ind[c]) % py
+                        out_stack[t, row, col] += patches[n, r, c]
+
+    @numba.njit(parallel=True, fastmath=True)
+    def _scatter_add_conjugate_product_imag_numba(
+        a, b, c, x0, y0, x_ind, y_ind, out_stack
+    ):
+        num_chunks, px, py = out_stack.shape
+        num_patches, sx, sy = a.shape
+        for t in numba.prange(num_chunks):
+            for n in range(t, num_patches, num_chunks):
+                for r in range(sx):
+                    row = (x0[n] + x_ind[r]) % px
+                    for s in range(sy):
+                        col = (y0[n] + y_ind[s]) % py
+                        out_stack[t, row, col] += (
+                            a[n, r, s].conjugate() * b[n, r, s].conjugate() * c[n, r, s]
+                        ).imag
+
+
+def scatter_add_patches(patches, x0, y0, x_ind, y_ind, object_shape, xp=np):
+    """
+    Sums real-valued (N,Sx,Sy) patches into an object-shaped array of the same
+    dtype, wrapping periodically. On the GPU, uses an atomicAdd kernel which avoids materializing
+    the flattened patch indices. On the CPU, uses a parallel numba scatter into
+    per-thread buffers if numba is available and those buffers are no larger
+    than the flattened indices, and bincount otherwise.
+
+    Parameters
+    ----------
+    patches: (N,Sx,Sy) np.ndarray
+        Real-valued patches to sum
+    x0, y0: (N,) np.ndarray
+        Integer patch origins along each axis
+    x_ind, y_ind: np.ndarray
+        Integer pixel offsets of the patch along each axis, of length Sx and Sy
+    object_shape: Tuple[int,int]
+        Shape of the output array
+    xp: Callable
+        Array computing module
+
+    Returns
+    -------
+    out_array: (Px,Py) np.ndarray
+        Summed array
+    """
+    if xp is np:
+        if numba is not None:
+            num_chunks = min(numba.get_num_threads(), patches.shape[0])
+            if num_chunks * np.prod(object_shape) <= patches.size:
+                out_stack = np.zeros((num_chunks,) + tuple(object_shape))
+                _scatter_add_patches_numba(
+                    np.ascontiguousarray(patches),
+                    x0,
+                    y0,
+                    x_ind,
+                    y_ind,
+                    out_stack,
+                )
+                return out_stack.sum(axis=0).astype(patches.dtype, copy=False)
+
+        indices = ((y0[:, None, None] + y_ind[None, None, :]) % object_shape[1]) + (
+            (x0[:, None, None] + x_ind[None, :, None]) % object_shape[0]
+        ) * object_shape[1]
+        counts = xp.bincount(
+            indices.ravel(), weights=patches.ravel(), minlength=np.prod(object_shape)
+        )
+        return xp.reshape(counts, object_shape).astype(patches.dtype, copy=False)
+
+    out = xp.zeros(object_shape, dtype=patches.dtype)
+    _scatter_add_patches_kernel(
+        patches,
+        x0.astype(xp.int32),
+        y0.astype(xp.int32),
+        x_ind.astype(xp.int32),
+        y_ind.astype(xp.int32),
+        np.int32(patches.shape[-2]),
+        np.int32(patches.shape[-1]),
+        np.int32(object_shape[0]),
+        np.int32(object_shape[1]),
+        out,
+    )
+    return out
+
+
+def scatter_add_conjugate_product_imag(
+    a, b, c, x0, y0, x_ind, y_ind, object_shape, xp=np
+):
+    """
+    Sums imag(conj(a) * conj(b) * c) patches into an object-shaped array,
+    wrapping periodically. On the CPU, the product is evaluated inside the
+    parallel numba scatter if numba is available and the per-thread buffers are
+    no larger than the patches, so the real-valued patches are never stored.
+    Otherwise calls conjugate_product_imag followed by scatter_add_patches.
+
+    Parameters
+    ----------
+    a, b: (N,Sx,Sy) np.ndarray
+        Complex patches entering conjugated
+    c: (N,Sx,Sy) np.ndarray
+        Complex patches
+    x0, y0: (N,) np.ndarray
+        Integer patch origins along each axis
+    x_ind, y_ind: np.ndarray
+        Integer pixel offsets of the patch along each axis, of length Sx and Sy
+    object_shape: Tuple[int,int]
+        Shape of the output array
+    xp: Callable
+        Array computing module
+
+    Returns
+    -------
+    out_array: (Px,Py) np.ndarray
+        Summed array
+    """
+    if xp is np and numba is not None:
+        num_chunks = min(numba.get_num_threads(), a.shape[0])
+        if num_chunks * np.prod(object_shape) <= a.size:
+            out_stack = np.zeros((num_chunks,) + tuple(object_shape))
+            _scatter_add_conjugate_product_imag_numba(
+                np.ascontiguousarray(a),
+                np.ascontiguousarray(b),
+                np.ascontiguousarray(c),
+                x0,
+                y0,
+                x_ind,
+                y_ind,
+                out_stack,
+            )
+            return out_stack.sum(axis=0).astype(a.real.dtype, copy=False)
+
+    return scatter_add_patches(
+        conjugate_product_imag(a, b, c, xp),
+        x0,
+        y0,
+        x_ind,
+        y_ind,
+        object_shape,
+        xp,
+    )
+
+
+### Slicing functions
+
+if numba is not None:
+
+    @numba.njit(parallel=True, fastmath=True)
+    def _project_sliced_volume_numba(volume, voxels_per_slice, out):
+        input_z, ny, nx = volume.shape
+        for y in numba.prange(ny):
+            for s in range(out.shape[0]):
+                for x in range(nx):
+                    out[s, y, x] = 0
+                for z in range(
+                    s * voxels_per_slice, min((s + 1) * voxels_per_slice, input_z)
+                ):
+                    for x in range(nx):
+                        out[s, y, x] += volume[z, y, x]
+
+    @numba.njit(parallel=True, fastmath=True)
+    def _expand_sliced_volume_numba(array, voxels_per_slice, inverse_counts, out):
+        output_z, ny, nx = out.shape
+        for y in numba.prange(ny):
+            for z in range(output_z):
+                s = z // voxels_per_slice
+                for x in range(nx):
+                    out[z, y, x] = array[s, y, x] * inverse_counts[s]
+
+
+def project_sliced_volume(array, output_z, xp=np):
+    """
+    Projects a voxel-sliced 3D array onto output_z slices, summing
+    consecutive voxels along the first axis.
+    On the CPU, uses a parallel numba kernel if numba is available.
+
+    Parameters
+    ----------
+    array: np.ndarray
+        3D array to project
+    output_z: int
+        Number of output slices
+    xp: Callable
+        Array computing module
+
+    Returns
+    -------
+        Projected array of shape (output_z,) + array.shape[1:]
+    """
+    input_z = array.shape[0]
+    voxels_per_slice = int(np.ceil(input_z / output_z))
+
+    if xp is np and numba is not None:
+        array = np.ascontiguousarray(array)
+        out = np.empty((output_z,) + array.shape[1:], dtype=array.dtype)
+        _project_sliced_volume_numba(array, voxels_per_slice, out)
+        return out
+
+    pad_size = voxels_per_slice * output_z - input_z
+    padded_array = xp.pad(array, ((0, pad_size), (0, 0), (0, 0)))
+
+    return xp.sum(
+        padded_array.reshape((-1, voxels_per_slice) + array.shape[1:]),
+        axis=1,
+    )
+
+
+def expand_sliced_volume(array, output_z, xp=np):
+    """
+    Expands a supersliced 3D array onto output_z voxels, spreading each slice
+    uniformly over its voxels along the first axis.
+    On the CPU, uses a parallel numba kernel if numba is available.
+
+    Parameters
+    ----------
+    array: np.ndarray
+        3D array to expand
+    output_z: int
+        Number of output voxels
+    xp: Callable
+        Array computing module
+
+    Returns
+    -------
+        Expanded array of shape (output_z,) + array.shape[1:]
+    """
+    input_z = array.shape[0]
+
+    voxels_per_slice = int(np.ceil(output_z / input_z))
+    remainder_size = voxels_per_slice - (voxels_per_slice * input_z - output_z)
+
+    voxels_in_slice = np.repeat(voxels_per_slice, input_z)
+    voxels_in_slice[-1] = remainder_size if remainder_size > 0 else voxels_per_slice
+    inverse_counts = (1 / voxels_in_slice).astype(np.float32)
+
+    if xp is np and numba is not None:
+        array = np.ascontiguousarray(array)
+        out = np.empty((output_z,) + array.shape[1:], dtype=array.dtype)
+        _expand_sliced_volume_numba(array, voxels_per_slice, inverse_counts, out)
+        return out
+
+    normalized_array = (
+        array / xp.asarray(voxels_in_slice, dtype=xp.float32)[:, None, None]
+    )
+    return xp.repeat(normalized_array, voxels_per_slice, axis=0)[:output_z]
+
+
 ### Batching functions
 
 
@@ -766,6 +1393,57 @@ class AffineTransform:
         )
 
 
+def solve_position_updates(coefficients_matrix, difference_intensity, xp=np):
+    """
+    Solves the per-probe least squares problems for the position updates.
+
+    The partial intensities are real, so the normal equations reduce to a
+    real-symmetric 2x2 Gram system per probe, solved in closed form. Probes
+    with a singular system, e.g. flat or zero-gradient object patches, get a
+    zero update rather than inf/nan.
+
+    Parameters
+    ----------
+    coefficients_matrix: (N,K,2) np.ndarray
+        Partial intensity derivatives along x and y
+    difference_intensity: (N,K) np.ndarray
+        Measured minus estimated intensities
+    xp: Callable
+        Array computing module
+
+    Returns
+    -------
+    positions_update: (N,2) np.ndarray
+        Least squares position updates
+    """
+    gram_matrix = xp.einsum("nki,nkj->nij", coefficients_matrix, coefficients_matrix)
+    projected_difference = xp.einsum(
+        "nki,nk->ni", coefficients_matrix, difference_intensity
+    )
+
+    gram_determinant = (
+        gram_matrix[:, 0, 0] * gram_matrix[:, 1, 1]
+        - gram_matrix[:, 0, 1] * gram_matrix[:, 1, 0]
+    )
+    positions_update = xp.stack(
+        (
+            gram_matrix[:, 1, 1] * projected_difference[:, 0]
+            - gram_matrix[:, 0, 1] * projected_difference[:, 1],
+            gram_matrix[:, 0, 0] * projected_difference[:, 1]
+            - gram_matrix[:, 1, 0] * projected_difference[:, 0],
+        ),
+        axis=-1,
+    )
+
+    # singular relative to the scale of the Gram matrix, including all-zero
+    gram_trace = gram_matrix[:, 0, 0] + gram_matrix[:, 1, 1]
+    singular = xp.abs(gram_determinant) <= 1e-12 * gram_trace**2
+    positions_update /= xp.where(singular, 1, gram_determinant)[:, None]
+    positions_update[singular] = 0
+
+    return positions_update
+
+
 def estimate_global_transformation(
     positions0: np.ndarray,
     positions1: np.ndarray,
@@ -4,6 +4,28 @@ import dask.array as da
 from emdfile import tqdmnd
 from py4DSTEM.classes import Calibration
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+if numba is not None:
+
+    @numba.njit(parallel=True, fastmath=True)
+    def _shifted_detector_sum_numba(
+        data, qx_ind, qy_ind, weights, qx_shift, qy_shift, out
+    ):
+        R_Nx, R_Ny, Q_Nx, Q_Ny = data.shape
+        for rx in numba.prange(R_Nx):
+            for ry in range(R_Ny):
+                acc = out[rx,ry]
+                for k in range(weights.shape[0]):
+                    qx = (qx_ind[k] + qx_shift[rx,ry]) % Q_Nx
+                    qy = (qy_ind[k] + qy_shift[rx,ry]) % Q_Ny
+                    acc += data[rx,ry,qx,qy] * weights[k]
+                out[rx,ry] = acc
+
+
 def get_virtual_image(
     datacube,
     mode,
@@ -57,7 +79,9 @@ def get_virtual_image(
             must be set (centered = True). The shift applied to each pattern is
             the difference between the local origin position and the mean origin
             position over all patterns, rounded to the nearest integer for speed.
-        verbose (bool): if True, show progress bar
+        verbose (bool): if True, show progress bar. With shift_center=True
+            and numba installed, verbose=False selects the faster parallel
+            numba kernel, which reports no progress
         dask (bool): if True, use dask arrays
         return_mask (bool or tuple): if False (default) returns a virtual image
             as usual. If True, does *not* generate or return a virtual image,
@@ -106,33 +130,47 @@ def get_virtual_image(
         # dask 
         if dask == True:
 
-            # set up a generalized universal function for dask distribution
-            def _apply_mask_dask(datacube,mask):
-                virtual_image = np.sum(np.multiply(datacube.data,mask), dtype=np.float64)
-            apply_mask_dask = da.as_gufunc(
-                _apply_mask_dask,signature='(i,j),(i,j)->()',
-                output_dtypes=np.float64,
-                axes=[(2,3),(0,1),()],
-                vectorize=True
-            )
-
-            # compute
-            virtual_image = apply_mask_dask(datacube.data, mask)
+            # contract the diffraction axes of each chunk with the mask, in
+            # parallel over chunks of scan positions
+            data = datacube.data
+            if not isinstance(data, da.Array):
+                data = da.from_array(data, chunks = ('auto','auto',-1,-1))
+            _mask = mask.astype(np.promote_types(mask.dtype, np.float64), copy=False)
+            virtual_image = da.tensordot(
+                data,
+                _mask,
+                axes = ([2,3],[0,1])
+            ).compute()
 
         # non-dask
         else:
 
             # compute
-            if mask.dtype == 'complex':
-                virtual_image = np.zeros(datacube.Rshape, dtype = 'complex')
-            else:
-                virtual_image = np.zeros(datacube.Rshape)
-            for rx,ry in tqdmnd(
+            # the mask is the same at every scan position, so each row of
+            # the scan is a single contraction over the diffraction axes.
+            # Promoting the mask to float keeps integer data from overflowing
+            _mask = mask.astype(np.promote_types(mask.dtype, np.float64), copy=False)
+            virtual_image = np.zeros(datacube.Rshape, dtype = _mask.dtype)
+
+            # for sparse detectors, only the pixels inside the mask are read
+            qidx = np.flatnonzero(_mask)
+            sparse = qidx.size < _mask.size // 2
+            weights = _mask.ravel()[qidx]
+
+            for rx in tqdmnd(
                 datacube.R_Nx,
-                datacube.R_Ny,
                 disable = not verbose,
             ):
-                virtual_image[rx,ry] = np.sum(datacube.data[rx,ry]*mask)
+                if sparse:
+                    virtual_image[rx] = datacube.data[rx].reshape(
+                        datacube.R_Ny, -1
+                    )[:,qidx] @ weights
+                else:
+                    virtual_image[rx] = np.tensordot(
+                        datacube.data[rx],
+                        _mask,
+                        axes = ([1,2],[0,1])
+                    )
 
     # with center shifting
     else:
@@ -158,23 +196,51 @@ def get_virtual_image(
             return _mask
 
         # compute
-        if mask.dtype == 'complex':
-            virtual_image = np.zeros(datacube.Rshape, dtype = 'complex')
-        else:
-            virtual_image = np.zeros(datacube.Rshape)
-
-        for rx,ry in tqdmnd(
-            datacube.R_Nx,
-            datacube.R_Ny,
-            disable = not verbose,
+        # rolling the mask by a shift is equivalent to reading the data at the
+        # mask's nonzero pixels offset by that shift, so the shifted pixel
+        # indices for a whole scan row are built at once by broadcasting
+        qx_ind, qy_ind = np.nonzero(mask)
+        weights = mask[qx_ind, qy_ind]
+        weights = weights.astype(np.promote_types(weights.dtype, np.float64))
+        virtual_image = np.zeros(datacube.Rshape, dtype = weights.dtype)
+
+        # a point detector is a single pixel per pattern; gather it directly
+        if mode == 'point':
+            qx = (qx_ind[0] + qx_shift) % datacube.Q_Nx
+            qy = (qy_ind[0] + qy_shift) % datacube.Q_Ny
+            virtual_image[:] = datacube.data[
+                np.arange(datacube.R_Nx)[:,None],
+                np.arange(datacube.R_Ny)[None,:],
+                qx,
+                qy
+            ]
+
+        # fuse the shifted gather and the weighted sum, parallel over the scan.
+        # The kernel reports no progress, so verbose keeps the row loop below
+        elif (
+            numba is not None
+            and not verbose
+            and isinstance(datacube.data, np.ndarray)
         ):
-            # get shifted mask
-            _mask = np.roll(
-                mask,
-                (qx_shift[rx,ry], qy_shift[rx,ry]),
-                axis=(0,1)
+            _shifted_detector_sum_numba(
+                np.asarray(datacube.data),
+                qx_ind,
+                qy_ind,
+                weights,
+                qx_shift,
+                qy_shift,
+                virtual_image
             )
-            virtual_image[rx,ry] = np.sum(datacube.data[rx,ry]*_mask)
+
+        else:
+            ry = np.arange(datacube.R_Ny)[:,None]
+            for rx in tqdmnd(
+                datacube.R_Nx,
+                disable = not verbose,
+            ):
+                qx = (qx_ind + qx_shift[rx,:,None]) % datacube.Q_Nx
+                qy = (qy_ind + qy_shift[rx,:,None]) % datacube.Q_Ny
+                virtual_image[rx] = datacube.data[rx][ry,qx,qy] @ weights
 
     return virtual_image
 
@@ -299,8 +365,8 @@ def make_detector(
         assert(isinstance(g,tuple) and len(g)==2), 'specify qx and qy as tuple (qx, qy)'
         mask = np.zeros(shape, dtype=bool)
 
-        qx = int(g[0])
-        qy = int(g[1])
+        qx = int(np.round(g[0]))
+        qy = int(np.round(g[1]))
 
         mask[qx,qy] = 1
 
@@ -309,7 +375,7 @@ def make_detector(
         assert(isinstance(g,tuple) and len(g)==2 and len(g[0])==2 and isinstance(g[1],(float,int))), \
         'specify qx, qy, radius_i as ((qx, qy), radius)'
 
-        qxa, qya = np.indices(shape)
+        qxa, qya = _qgrid(shape)
         mask = (qxa - g[0][0]) ** 2 + (qya - g[0][1]) ** 2 < g[1] ** 2
 
     #annular mask 
@@ -319,10 +385,9 @@ def make_detector(
 
         assert g[1][1] > g[1][0], "Inner radius must be smaller than outer radius"
 
-        qxa, qya = np.indices(shape)
-        mask1 = (qxa - g[0][0]) ** 2 + (qya - g[0][1]) ** 2 > g[1][0] ** 2
-        mask2 = (qxa - g[0][0]) ** 2 + (qya - g[0][1]) ** 2 < g[1][1] ** 2
-        mask = np.logical_and(mask1, mask2)
+        qxa, qya = _qgrid(shape)
+        qr2 = (qxa - g[0][0]) ** 2 + (qya - g[0][1]) ** 2
+        mask = np.logical_and(qr2 > g[1][0] ** 2, qr2 < g[1][1] ** 2)
 
     #rectangle mask 
     if mode in('rectangle', 'square', 'rectangular') :
@@ -344,6 +409,16 @@ def make_detector(
         mask = g
     return mask
 
+
+def _qgrid(shape):
+    """
+    Open grid of detector pixel indices, (shape[0],1) and (1,shape[1]),
+    which broadcast against each other like np.indices(shape) without
+    materializing two full 2D arrays.
+    """
+    return np.ogrid[:shape[0], :shape[1]]
+
+
 def make_bragg_mask(
     Qshape,
     g1,
@@ -814,6 +814,17 @@ def Complex2RGB(complex_data, vmin=None, vmax = None, hue_start = 0, invert=Fals
     inverse (bool)      : if True, uses light color scheme
     """
     amp = np.abs(complex_data)
+
+    # unit phasor exp(i*(phase + hue_start)); its real and imaginary parts
+    # give the cos and sin of the hue angle without any trig calls
+    phasor = np.divide(
+        complex_data,
+        amp,
+        out = np.ones(amp.shape, dtype=np.result_type(complex_data, 1j)),
+        where = amp != 0,
+    )
+    phasor *= np.exp(1j*np.deg2rad(hue_start))
+
     if np.isclose(np.max(amp),np.min(amp)):
         if vmin is None:
             vmin = 0
@@ -835,12 +846,11 @@ def Complex2RGB(complex_data, vmin=None, vmax = None, hue_start = 0, invert=Fals
     amp = np.where(amp < vmin, vmin, amp)
     amp = np.where(amp > vmax, vmax, amp)
 
-    phase = np.angle(complex_data) + np.deg2rad(hue_start)
     amp /= np.max(amp)
-    rgb = np.zeros(phase.shape +(3,))
-    rgb[...,0] = 0.5*(np.sin(phase)+1)*amp
-    rgb[...,1] = 0.5*(np.sin(phase+np.pi/2)+1)*amp
-    rgb[...,2] = 0.5*(-np.sin(phase)+1)*amp
+    rgb = np.zeros(phasor.shape +(3,))
+    rgb[...,0] = 0.5*(phasor.imag+1)*amp
+    rgb[...,1] = 0.5*(phasor.real+1)*amp
+    rgb[...,2] = 0.5*(-phasor.imag+1)*amp
     
     return 1-rgb if invert else rgb
 
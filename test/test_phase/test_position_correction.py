@@ -0,0 +1,43 @@
+import numpy as np
+from py4DSTEM.process.phase.utils import solve_position_updates
+
+
+def _partial_intensities(object_patch, probe):
+    """Finite-difference intensity derivatives of a single patch along x and y"""
+    exit_wave_fft = np.fft.fft2(object_patch * probe)
+    dx_fft = exit_wave_fft - np.fft.fft2(np.roll(object_patch, -1, axis=0) * probe)
+    dy_fft = exit_wave_fft - np.fft.fft2(np.roll(object_patch, -1, axis=1) * probe)
+    return np.stack(
+        (
+            2 * np.real(dx_fft * exit_wave_fft.conj()).ravel(),
+            2 * np.real(dy_fft * exit_wave_fft.conj()).ravel(),
+        ),
+        axis=-1,
+    )
+
+
+def test_constant_object_patch_gives_zero_update():
+    rng = np.random.default_rng(0)
+    probe = rng.standard_normal((16, 16)) + 1j * rng.standard_normal((16, 16))
+
+    constant_patch = np.full((16, 16), np.exp(0.3j))
+    textured_patch = np.exp(1j * rng.standard_normal((16, 16)))
+
+    coefficients_matrix = np.stack(
+        (
+            _partial_intensities(constant_patch, probe),
+            _partial_intensities(textured_patch, probe),
+        )
+    )
+    difference_intensity = rng.standard_normal(coefficients_matrix.shape[:2])
+
+    positions_update = solve_position_updates(coefficients_matrix, difference_intensity)
+
+    assert np.all(np.isfinite(positions_update))
+    assert np.all(positions_update[0] == 0)
+
+    # non-singular systems match the least squares solution
+    expected = np.linalg.lstsq(
+        coefficients_matrix[1], difference_intensity[1], rcond=None
+    )[0]
+    assert np.allclose(positions_update[1], expected)